@@ -6,14 +6,68 @@ This example demonstrates the asynchronous capabilities of the CLIP Python SDK,
 showing how to fetch CLIP objects efficiently using async/await syntax.
 """
 
+import argparse
 import asyncio
 import time
-from typing import List
 
 from clip_sdk import CLIPFetcher, AsyncCLIPFetcher
 
 
-async def main():
+async def run_real_benchmark(url_count: int = 10) -> None:
+    """Benchmark sequential vs concurrent fetching against a local server."""
+    import json
+    import tempfile
+    import threading
+    from functools import partial
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+    from pathlib import Path
+
+    clip_object = {
+        "@context": "https://clipprotocol.org/v1",
+        "type": "Venue",
+        "id": "clip:benchmark:venue:local",
+        "name": "Benchmark Venue",
+        "description": "Synthetic CLIP object served for benchmarking",
+    }
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass  # Keep benchmark output readable
+
+    with tempfile.TemporaryDirectory() as serve_dir:
+        for i in range(url_count):
+            Path(serve_dir, f"clip-{i}.json").write_text(json.dumps(clip_object))
+
+        handler = partial(QuietHandler, directory=serve_dir)
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_address[1]
+        urls = [f"http://127.0.0.1:{port}/clip-{i}.json" for i in range(url_count)]
+
+        try:
+            async with AsyncCLIPFetcher(cache_enabled=False) as fetcher:
+                start = time.perf_counter()
+                for url in urls:
+                    await fetcher.fetch(url)
+                sequential_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                await fetcher.fetch_batch(urls)
+                concurrent_time = time.perf_counter() - start
+
+            print(f"📈 Performance Results ({url_count} URLs, local server):")
+            print(f"   Sequential fetch: {sequential_time:.3f} seconds")
+            print(f"   Concurrent batch: {concurrent_time:.3f} seconds")
+            if concurrent_time > 0:
+                print(
+                    f"   🚀 Speedup: {sequential_time / concurrent_time:.1f}x "
+                    "faster with async!"
+                )
+        finally:
+            server.shutdown()
+
+
+async def main(run_benchmark: bool = False):
     """Main async example function."""
     print("🚀 CLIP SDK Async Functionality Demo\n")
     
@@ -35,13 +89,16 @@ async def main():
     print("1️⃣ Basic Async Fetching")
     print("=" * 50)
     
+    # The fetcher holds one shared HTTP session, so wrap usage in
+    # `async with` (or call `await fetcher.close()`) to release connections.
     async_fetcher = AsyncCLIPFetcher(cache_enabled=True)
-    
+
     try:
         print("Attempting to fetch a single CLIP object asynchronously...")
         # This would work with a real URL
-        # result = await async_fetcher.fetch(test_urls[0])
-        # print(f"✅ Successfully fetched: {result.get('name', 'Unknown')}")
+        # async with AsyncCLIPFetcher(cache_enabled=True) as fetcher:
+        #     result = await fetcher.fetch(test_urls[0])
+        #     print(f"✅ Successfully fetched: {result.get('name', 'Unknown')}")
         print("⚠️  Skipping actual fetch (demo URLs)")
     except Exception as e:
         print(f"❌ Expected error with demo URLs: {type(e).__name__}")
@@ -79,33 +136,12 @@ async def main():
     print("3️⃣ Sync vs Async Performance Comparison")
     print("=" * 50)
     
-    print("Comparing sync vs async fetching performance...")
-    
-    # Sync fetcher
-    sync_fetcher = CLIPFetcher(cache_enabled=True)
-    
-    def simulate_sync_batch_fetch(urls: List[str]) -> float:
-        """Simulate sync batch fetching time."""
-        start_time = time.time()
-        # Simulate sequential fetching delay
-        time.sleep(0.1 * len(urls))  # 100ms per URL
-        return time.time() - start_time
-    
-    async def simulate_async_batch_fetch(urls: List[str]) -> float:
-        """Simulate async batch fetching time."""
-        start_time = time.time()
-        # Simulate concurrent fetching delay (much faster)
-        await asyncio.sleep(0.1)  # 100ms total for all URLs
-        return time.time() - start_time
-    
-    # Simulate performance comparison
-    sync_time = simulate_sync_batch_fetch(test_urls)
-    async_time = await simulate_async_batch_fetch(test_urls)
-    
-    print(f"📈 Performance Results (simulated):")
-    print(f"   Sync batch fetch:  {sync_time:.2f} seconds")
-    print(f"   Async batch fetch: {async_time:.2f} seconds") 
-    print(f"   🚀 Speedup: {sync_time / async_time:.1f}x faster with async!")
+    if run_benchmark:
+        # Real measurement against a throwaway local HTTP server
+        await run_real_benchmark()
+    else:
+        print("⚠️  Benchmark skipped (run with --bench to measure against a")
+        print("    local HTTP server — no artificial sleeps, real numbers)")
     print()
     
     # 4. Async with caching
@@ -208,7 +244,12 @@ async def main():
     print("   • Graceful error handling with exceptions")
     print("   • Backward compatibility with existing code")
     print()
+    # Release the shared HTTP sessions held by the fetchers
+    await async_fetcher.close()
+    await cached_fetcher.close()
+
     print("💡 Best Practices:")
+    print("   • Use 'async with AsyncCLIPFetcher(...)' to manage the session")
     print("   • Use AsyncCLIPFetcher for new async applications")
     print("   • Use CLIPFetcher.fetch_async() for mixed sync/async code")
     print("   • Set appropriate max_concurrent limits")
@@ -223,13 +264,21 @@ async def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CLIP SDK async example")
+    parser.add_argument(
+        "--bench",
+        action="store_true",
+        help="run a real sync-vs-async benchmark against a local HTTP server",
+    )
+    args = parser.parse_args()
+
     # Run the async example
     print("Starting CLIP SDK Async Example...")
     print("Note: This example uses demo URLs for illustration.")
     print("Replace with real CLIP object URLs for actual testing.\n")
     
     try:
-        asyncio.run(main())
+        asyncio.run(main(run_benchmark=args.bench))
     except KeyboardInterrupt:
         print("\n👋 Example interrupted by user")
     except Exception as e:
@@ -5,11 +5,40 @@ This module provides placeholder implementations for visual CLIP decoding/encodi
 Visual representations (QR codes, HexMatrix) are planned for a future release.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+# Options/data objects are created per decode/encode call, so use slotted
+# frozen dataclasses where the runtime supports it (slots needs 3.10+).
+if sys.version_info >= (3, 10):
+    _dataclass_opts = {"frozen": True, "slots": True}
+else:
+    _dataclass_opts = {"frozen": True}
+
+# Hoisted validation constants: frozensets give O(1) membership checks and
+# avoid rebuilding a list on every decode/encode validation call.
+_PLANNED_FORMATS = ("qr", "hexmatrix")
+_FORMATS = frozenset(_PLANNED_FORMATS)
+_ERROR_CORRECTION_LEVELS = frozenset(("low", "medium", "high"))
+_REQUIRED_CLIP_FIELDS = ("@context", "type", "id", "name", "description")
+_REQUIRED_CLIP_FIELD_SET = frozenset(_REQUIRED_CLIP_FIELDS)
+
+# Library metadata is constant for the process; expose a read-only view so
+# repeated get_library_info calls are allocation-free.
+_LIBRARY_INFO = MappingProxyType(
+    {
+        "name": "clip-decoder-python",
+        "version": "0.1.0",
+        "status": "stub-implementation",
+        "supported_formats": [],  # Empty until actual implementation
+        "planned_formats": list(_PLANNED_FORMATS),
+    }
+)
 
 
-@dataclass
+@dataclass(**_dataclass_opts)
 class DecodeOptions:
     """Options for decoding visual CLIP representations."""
 
@@ -18,17 +47,16 @@ class DecodeOptions:
     strict_mode: bool = False
 
     def __post_init__(self):
-        if self.format and self.format not in ["qr", "hexmatrix"]:
+        if self.format and self.format not in _FORMATS:
             raise ValueError("Format must be 'qr' or 'hexmatrix'")
-        if self.error_correction and self.error_correction not in [
-            "low",
-            "medium",
-            "high",
-        ]:
+        if (
+            self.error_correction
+            and self.error_correction not in _ERROR_CORRECTION_LEVELS
+        ):
             raise ValueError("Error correction must be 'low', 'medium', or 'high'")
 
 
-@dataclass
+@dataclass(**_dataclass_opts)
 class EncodeOptions:
     """Options for encoding CLIP objects as visual representations."""
 
@@ -38,13 +66,13 @@ class EncodeOptions:
     margin: Optional[int] = None
 
     def __post_init__(self):
-        if self.format not in ["qr", "hexmatrix"]:
+        if self.format not in _FORMATS:
             raise ValueError("Format must be 'qr' or 'hexmatrix'")
-        if self.error_correction not in ["low", "medium", "high"]:
+        if self.error_correction not in _ERROR_CORRECTION_LEVELS:
             raise ValueError("Error correction must be 'low', 'medium', or 'high'")
 
 
-@dataclass
+@dataclass(**_dataclass_opts)
 class VisualData:
     """Visual representation data of a CLIP object."""
 
@@ -76,7 +104,7 @@ def decode_visual(
     if not image_data:
         raise ValueError("Image data is required")
 
-    if options and options.format and options.format not in ["qr", "hexmatrix"]:
+    if options and options.format and options.format not in _FORMATS:
         raise ValueError("Invalid format specified. Supported formats: qr, hexmatrix")
 
     raise NotImplementedError("Visual CLIP decoding is planned for a future release")
@@ -107,14 +135,15 @@ def encode_visual(clip_object: Dict[str, Any], options: EncodeOptions) -> Visual
     if not options.format:
         raise ValueError("Format is required in encode options")
 
-    if options.format not in ["qr", "hexmatrix"]:
+    if options.format not in _FORMATS:
         raise ValueError("Invalid format specified. Supported formats: qr, hexmatrix")
 
-    # Basic CLIP object validation
-    required_fields = ["@context", "type", "id", "name", "description"]
-    for field in required_fields:
-        if field not in clip_object:
-            raise ValueError(f"Required CLIP field missing: {field}")
+    # Basic CLIP object validation: one set-containment check on the happy
+    # path, falling back to a scan only to name the first missing field
+    if not _REQUIRED_CLIP_FIELD_SET <= clip_object.keys():
+        for field in _REQUIRED_CLIP_FIELDS:
+            if field not in clip_object:
+                raise ValueError(f"Required CLIP field missing: {field}")
 
     raise NotImplementedError("Visual CLIP encoding is planned for a future release")
 
@@ -129,24 +158,17 @@ def is_format_supported(format_name: str) -> bool:
     Returns:
         True if format is recognized (but not yet implemented)
     """
-    supported_formats = ["qr", "hexmatrix"]
-    return format_name in supported_formats
+    return format_name in _FORMATS
 
 
-def get_library_info() -> Dict[str, Any]:
+def get_library_info() -> Mapping[str, Any]:
     """
     Get information about the decoder library.
 
     Returns:
-        Library information dictionary
+        Library information mapping (read-only)
     """
-    return {
-        "name": "clip-decoder-python",
-        "version": "0.1.0",
-        "status": "stub-implementation",
-        "supported_formats": [],  # Empty until actual implementation
-        "planned_formats": ["qr", "hexmatrix"],
-    }
+    return _LIBRARY_INFO
 
 
 def get_supported_formats() -> List[str]:
@@ -156,7 +178,7 @@ def get_supported_formats() -> List[str]:
     Returns:
         List of format names that will be supported
     """
-    return ["qr", "hexmatrix"]
+    return list(_PLANNED_FORMATS)
 
 
 # Export all public classes and functions
@@ -0,0 +1,23 @@
+"""
+Shared fixtures for decoder library tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def mock_clip_object():
+    """A minimal valid CLIP object, built once per test session."""
+    return {
+        "@context": "https://clipprotocol.org/v1",
+        "type": "Venue",
+        "id": "clip:test:venue:123",
+        "name": "Test Venue",
+        "description": "A test venue for decoder testing",
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_image_data():
+    """Mock visual payload bytes, built once per test session."""
+    return b"\x01\x02\x03\x04\x05"
@@ -1,7 +1,13 @@
 """
 Tests for CLIP Decoder Library - Python Stub Implementation
+
+Shared inputs live in session-scoped fixtures (see conftest.py) so they
+are built once per run instead of re-allocated before every test.
 """
 
+import re
+import sys
+
 import pytest
 
 from decoder_lib import (
@@ -15,24 +21,27 @@ from decoder_lib import (
     is_format_supported,
 )
 
+# Precompiled pytest.raises match patterns shared across tests
+_FORMAT_RE = re.compile(r"Format must be 'qr' or 'hexmatrix'")
+_EC_RE = re.compile(r"Error correction must be 'low', 'medium', or 'high'")
+_DECODE_NOT_IMPL_RE = re.compile(
+    r"Visual CLIP decoding is planned for a future release"
+)
+_ENCODE_NOT_IMPL_RE = re.compile(
+    r"Visual CLIP encoding is planned for a future release"
+)
 
-class TestDecoderLib:
-    """Test suite for the Python decoder library stub implementation."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_clip_object = {
-            "@context": "https://clipprotocol.org/v1",
-            "type": "Venue",
-            "id": "clip:test:venue:123",
-            "name": "Test Venue",
-            "description": "A test venue for decoder testing",
-        }
-
-        self.mock_image_data = b"\x01\x02\x03\x04\x05"
+# Expected library metadata, allocated once instead of per test run
+_EXPECTED_LIB_INFO = {
+    "name": "clip-decoder-python",
+    "version": "0.1.0",
+    "status": "stub-implementation",
+    "supported_formats": [],
+    "planned_formats": ["qr", "hexmatrix"],
+}
 
 
-class TestDecodeOptions(TestDecoderLib):
+class TestDecodeOptions:
     """Test DecodeOptions class."""
 
     def test_default_construction(self):
@@ -42,39 +51,28 @@ class TestDecodeOptions(TestDecoderLib):
         assert options.error_correction is None
         assert options.strict_mode is False
 
-    def test_valid_format(self):
+    @pytest.mark.parametrize("fmt", ["qr", "hexmatrix"])
+    def test_valid_format(self, fmt):
         """Test valid format assignment."""
-        options = DecodeOptions(format="qr")
-        assert options.format == "qr"
-
-        options = DecodeOptions(format="hexmatrix")
-        assert options.format == "hexmatrix"
+        assert DecodeOptions(format=fmt).format == fmt
 
     def test_invalid_format(self):
         """Test invalid format raises ValueError."""
-        with pytest.raises(ValueError, match="Format must be 'qr' or 'hexmatrix'"):
+        with pytest.raises(ValueError, match=_FORMAT_RE):
             DecodeOptions(format="invalid")
 
-    def test_valid_error_correction(self):
+    @pytest.mark.parametrize("level", ["low", "medium", "high"])
+    def test_valid_error_correction(self, level):
         """Test valid error correction levels."""
-        options = DecodeOptions(error_correction="low")
-        assert options.error_correction == "low"
-
-        options = DecodeOptions(error_correction="medium")
-        assert options.error_correction == "medium"
-
-        options = DecodeOptions(error_correction="high")
-        assert options.error_correction == "high"
+        assert DecodeOptions(error_correction=level).error_correction == level
 
     def test_invalid_error_correction(self):
         """Test invalid error correction raises ValueError."""
-        with pytest.raises(
-            ValueError, match="Error correction must be 'low', 'medium', or 'high'"
-        ):
+        with pytest.raises(ValueError, match=_EC_RE):
             DecodeOptions(error_correction="invalid")
 
 
-class TestEncodeOptions(TestDecoderLib):
+class TestEncodeOptions:
     """Test EncodeOptions class."""
 
     def test_required_format(self):
@@ -83,17 +81,14 @@ class TestEncodeOptions(TestDecoderLib):
         assert options.format == "qr"
         assert options.error_correction == "medium"  # default
 
-    def test_valid_formats(self):
+    @pytest.mark.parametrize("fmt", ["qr", "hexmatrix"])
+    def test_valid_formats(self, fmt):
         """Test valid format assignment."""
-        options = EncodeOptions(format="qr")
-        assert options.format == "qr"
-
-        options = EncodeOptions(format="hexmatrix")
-        assert options.format == "hexmatrix"
+        assert EncodeOptions(format=fmt).format == fmt
 
     def test_invalid_format(self):
         """Test invalid format raises ValueError."""
-        with pytest.raises(ValueError, match="Format must be 'qr' or 'hexmatrix'"):
+        with pytest.raises(ValueError, match=_FORMAT_RE):
             EncodeOptions(format="invalid")
 
     def test_custom_options(self):
@@ -107,49 +102,61 @@ class TestEncodeOptions(TestDecoderLib):
         assert options.margin == 8
 
 
-class TestVisualData(TestDecoderLib):
+class TestVisualData:
     """Test VisualData class."""
 
-    def test_basic_construction(self):
+    def test_basic_construction(self, mock_image_data):
         """Test basic VisualData construction."""
-        data = VisualData(format="qr", data=self.mock_image_data)
+        data = VisualData(format="qr", data=mock_image_data)
         assert data.format == "qr"
-        assert data.data == self.mock_image_data
+        assert data.data == mock_image_data
         assert data.width is None
         assert data.height is None
         assert data.metadata is None
 
-    def test_full_construction(self):
+    def test_full_construction(self, mock_image_data):
         """Test VisualData with all fields."""
         metadata = {"version": "1.0", "timestamp": "2024-01-01T00:00:00Z"}
         data = VisualData(
             format="hexmatrix",
-            data=self.mock_image_data,
+            data=mock_image_data,
             width=256,
             height=256,
             metadata=metadata,
         )
         assert data.format == "hexmatrix"
-        assert data.data == self.mock_image_data
+        assert data.data == mock_image_data
         assert data.width == 256
         assert data.height == 256
         assert data.metadata == metadata
 
 
-class TestDecodeVisual(TestDecoderLib):
+class TestDecodeVisual:
     """Test decode_visual function."""
 
     def test_function_exists(self):
         """Test that decode_visual function exists and is callable."""
         assert callable(decode_visual)
 
-    def test_raises_not_implemented(self):
-        """Test that decode_visual raises NotImplementedError."""
+    @pytest.mark.parametrize(
+        "data,options",
+        [
+            (b"\x01\x02\x03\x04\x05", None),
+            (
+                b"\x01\x02\x03\x04\x05",
+                DecodeOptions(format="qr", error_correction="high"),
+            ),
+            ("base64data", None),
+        ],
+        ids=["bytes", "bytes-with-options", "string-data"],
+    )
+    def test_raises_not_implemented(self, data, options):
+        """Test that decode_visual raises NotImplementedError for valid inputs."""
         with pytest.raises(
             NotImplementedError,
-            match="Visual CLIP decoding is planned for a future release",
+            match=_DECODE_NOT_IMPL_RE,
         ):
-            decode_visual(self.mock_image_data)
+            decode_visual(data, options)
 
     def test_validates_image_data(self):
         """Test that decode_visual validates image data parameter."""
@@ -162,50 +169,29 @@ class TestDecodeVisual(TestDecoderLib):
         with pytest.raises(ValueError, match="Image data is required"):
             decode_visual(b"")
 
-    def test_validates_format_options(self):
-        """Test that decode_visual validates format options."""
-        # Test that invalid formats are caught during DecodeOptions construction
-        with pytest.raises(ValueError, match="Format must be 'qr' or 'hexmatrix'"):
-            DecodeOptions(format="invalid")
 
-    def test_accepts_valid_parameters(self):
-        """Test that decode_visual accepts valid parameters.
-
-        Should still raise NotImplementedError.
-        """
-        options = DecodeOptions(format="qr", error_correction="high")
-
-        with pytest.raises(
-            NotImplementedError,
-            match="Visual CLIP decoding is planned for a future release",
-        ):
-            decode_visual(self.mock_image_data, options)
-
-    def test_accepts_string_data(self):
-        """Test that decode_visual accepts string data."""
-        with pytest.raises(
-            NotImplementedError,
-            match="Visual CLIP decoding is planned for a future release",
-        ):
-            decode_visual("base64data")
-
-
-class TestEncodeVisual(TestDecoderLib):
+class TestEncodeVisual:
     """Test encode_visual function."""
 
     def test_function_exists(self):
         """Test that encode_visual function exists and is callable."""
         assert callable(encode_visual)
 
-    def test_raises_not_implemented(self):
-        """Test that encode_visual raises NotImplementedError."""
-        options = EncodeOptions(format="qr")
-
+    @pytest.mark.parametrize(
+        "options",
+        [
+            EncodeOptions(format="qr"),
+            EncodeOptions(format="hexmatrix", error_correction="high"),
+        ],
+        ids=["qr-defaults", "hexmatrix-high"],
+    )
+    def test_raises_not_implemented(self, mock_clip_object, options):
+        """Test that encode_visual raises NotImplementedError for valid inputs."""
         with pytest.raises(
             NotImplementedError,
-            match="Visual CLIP encoding is planned for a future release",
+            match=_ENCODE_NOT_IMPL_RE,
         ):
-            encode_visual(self.mock_clip_object, options)
+            encode_visual(mock_clip_object, options)
 
     def test_validates_clip_object(self):
         """Test that encode_visual validates CLIP object parameter."""
@@ -217,10 +203,10 @@ class TestEncodeVisual(TestDecoderLib):
         with pytest.raises(ValueError, match="CLIP object is required"):
             encode_visual({}, options)
 
-    def test_validates_options(self):
+    def test_validates_options(self, mock_clip_object):
         """Test that encode_visual validates options parameter."""
         with pytest.raises(ValueError, match="Encode options are required"):
-            encode_visual(self.mock_clip_object, None)
+            encode_visual(mock_clip_object, None)
 
     def test_validates_required_clip_fields(self):
         """Test that encode_visual validates required CLIP fields."""
@@ -230,41 +216,31 @@ class TestEncodeVisual(TestDecoderLib):
         with pytest.raises(ValueError, match="Required CLIP field missing: type"):
             encode_visual(incomplete_clip, options)
 
-    def test_accepts_valid_parameters(self):
-        """Test that encode_visual accepts valid parameters.
-
-        Should still raise NotImplementedError.
-        """
-        options = EncodeOptions(format="hexmatrix", error_correction="high")
 
-        with pytest.raises(
-            NotImplementedError,
-            match="Visual CLIP encoding is planned for a future release",
-        ):
-            encode_visual(self.mock_clip_object, options)
-
-
-class TestIsFormatSupported(TestDecoderLib):
+class TestIsFormatSupported:
     """Test is_format_supported function."""
 
     def test_function_exists(self):
         """Test that is_format_supported function exists and is callable."""
         assert callable(is_format_supported)
 
-    def test_supported_formats(self):
-        """Test that supported formats return True."""
-        assert is_format_supported("qr") is True
-        assert is_format_supported("hexmatrix") is True
-
-    def test_unsupported_formats(self):
-        """Test that unsupported formats return False."""
-        assert is_format_supported("barcode") is False
-        assert is_format_supported("invalid") is False
-        assert is_format_supported("") is False
-        assert is_format_supported("QR") is False  # case sensitive
-
-
-class TestGetLibraryInfo(TestDecoderLib):
+    @pytest.mark.parametrize(
+        "fmt,expected",
+        [
+            ("qr", True),
+            ("hexmatrix", True),
+            ("barcode", False),
+            ("invalid", False),
+            ("", False),
+            ("QR", False),  # case sensitive
+        ],
+    )
+    def test_format_supported(self, fmt, expected):
+        """Test format support for supported and unsupported names."""
+        assert is_format_supported(fmt) is expected
+
+
+class TestGetLibraryInfo:
     """Test get_library_info function."""
 
     def test_function_exists(self):
@@ -273,17 +249,7 @@ class TestGetLibraryInfo(TestDecoderLib):
 
     def test_returns_correct_info(self):
         """Test that get_library_info returns correct information."""
-        info = get_library_info()
-
-        expected = {
-            "name": "clip-decoder-python",
-            "version": "0.1.0",
-            "status": "stub-implementation",
-            "supported_formats": [],
-            "planned_formats": ["qr", "hexmatrix"],
-        }
-
-        assert info == expected
+        assert get_library_info() == _EXPECTED_LIB_INFO
 
     def test_consistent_results(self):
         """Test that get_library_info returns consistent results."""
@@ -293,7 +259,7 @@ class TestGetLibraryInfo(TestDecoderLib):
         assert info1 == info2
 
 
-class TestGetSupportedFormats(TestDecoderLib):
+class TestGetSupportedFormats:
     """Test get_supported_formats function."""
 
     def test_function_exists(self):
@@ -309,7 +275,7 @@ class TestGetSupportedFormats(TestDecoderLib):
         assert len(formats) == 2
 
 
-class TestModuleExports(TestDecoderLib):
+class TestModuleExports:
     """Test module exports and __all__."""
 
     def test_all_exports_available(self):
@@ -340,3 +306,11 @@ class TestModuleExports(TestDecoderLib):
         assert is_format_supported is not None
         assert get_library_info is not None
         assert get_supported_formats is not None
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True needs Python 3.10+")
+def test_option_classes_are_slotted():
+    """Option/data instances should not carry a per-instance __dict__."""
+    assert not hasattr(DecodeOptions(), "__dict__")
+    assert not hasattr(EncodeOptions(format="qr"), "__dict__")
+    assert not hasattr(VisualData(format="qr", data=b"\x00"), "__dict__")
@@ -5,13 +5,25 @@ A Python SDK for working with CLIP (Context Link Interface Protocol) objects.
 Includes both synchronous and asynchronous support for improved performance.
 """
 
+import importlib
+from typing import List
+
 __version__ = "0.1.0"
 
-from .async_fetcher import AsyncCLIPFetcher, AsyncCLIPFetchError
-from .cache import CacheEntry, CLIPCache, get_default_cache_dir
-from .clip_object import CLIPObject
-from .fetcher import CLIPFetcher, CLIPFetchError
-from .validator import CLIPValidator
+# Lazy attribute loading (PEP 562): submodules are imported on first access
+# so e.g. `from clip_sdk import CLIPValidator` doesn't pay for aiohttp and
+# the fetcher/cache machinery it never uses.
+_LAZY_ATTRS = {
+    "CLIPValidator": ".validator",
+    "CLIPFetcher": ".fetcher",
+    "CLIPFetchError": ".fetcher",
+    "AsyncCLIPFetcher": ".async_fetcher",
+    "AsyncCLIPFetchError": ".async_fetcher",
+    "CLIPObject": ".clip_object",
+    "CLIPCache": ".cache",
+    "CacheEntry": ".cache",
+    "get_default_cache_dir": ".cache",
+}
 
 __all__ = [
     "CLIPValidator",
@@ -25,3 +37,19 @@ __all__ = [
     "get_default_cache_dir",
     "__version__",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, name)
+    # Cache on the package so subsequent accesses skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
@@ -0,0 +1,69 @@
+"""
+Internal JSON helpers for the CLIP SDK.
+
+Uses orjson for parsing and byte-oriented serialization when it is
+installed (install the ``perf`` extra), falling back to the standard
+library json module otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    _orjson = None
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse JSON from a string or bytes.
+
+    Args:
+        data: JSON document as str, bytes, or bytearray
+
+    Returns:
+        The parsed Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to compact JSON bytes.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if _orjson is not None:
+        return _orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_pretty(obj: Any, indent: int = 2) -> bytes:
+    """
+    Serialize an object to indented JSON bytes for human-readable files.
+
+    orjson only supports two-space indentation, so other indent values
+    fall back to the standard library.
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation width
+
+    Returns:
+        UTF-8 encoded, indented JSON bytes
+    """
+    if _orjson is not None and indent == 2:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=indent, ensure_ascii=False).encode("utf-8")
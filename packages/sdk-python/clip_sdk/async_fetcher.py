@@ -5,17 +5,126 @@ Asynchronous CLIP object fetching with aiohttp.
 import asyncio
 import json
 import logging
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from urllib.parse import urlparse
 
 import aiohttp
 
+from . import _json
 from .cache import CLIPCache, get_default_cache_dir
-from .utils import load_json_from_path
 
 logger = logging.getLogger(__name__)
 
+# HTTP statuses worth retrying: transient server errors, timeouts, and
+# rate limiting. Client errors like 404 won't improve on a second attempt.
+_RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Upper bound for any single retry delay
+_RETRY_CAP_SECONDS = 30.0
+
+# Directory discovery prefilter: CLIP indicators show up within the first
+# few KiB of a document, so unrelated JSON files can be skipped without
+# parsing them in full.
+_PREFILTER_HEAD_BYTES = 8192
+
+# Structure-validation constants, hoisted since these checks run per fetch
+_REQUIRED_FIELDS = frozenset(("@context", "type", "id"))
+_CONTEXT_MARKER = "clipprotocol.org"
+_CLIP_TYPES = frozenset(("Venue", "Device", "SoftwareApp"))
+_CLIP_MARKERS = (
+    b"clipprotocol.org",
+    b'"clip:',
+    b'"Venue"',
+    b'"Device"',
+    b'"SoftwareApp"',
+)
+
+
+def _exc_message(exc: Optional[BaseException]) -> str:
+    """
+    Render an exception for log/error messages.
+
+    Shared by the retry path so the str()-with-fallback ladder exists
+    once instead of being inlined per call site. The try/except stays:
+    some aiohttp exceptions (e.g. ClientConnectorError wrapping an odd
+    os_error) can raise from __str__.
+    """
+    try:
+        return str(exc) or repr(exc)
+    except Exception:
+        return repr(exc)
+
+
+@lru_cache(maxsize=4096)
+def _is_url(source: str) -> bool:
+    """
+    Check if a source string is a URL.
+
+    Memoized at module level: batches dispatch on the same sources
+    repeatedly, and the common http(s) case is answered by a prefix test
+    without allocating a ParseResult.
+    """
+    if source.startswith(("http://", "https://")):
+        return True
+    try:
+        result = urlparse(source)
+        return bool(result.scheme and result.netloc)
+    except (ValueError, AttributeError):
+        return False
+
+
+def install_uvloop() -> bool:
+    """
+    Install uvloop as the event loop policy, if available.
+
+    uvloop is a drop-in libuv-based loop that typically runs aiohttp
+    workloads 2-4x faster than the default selector loop, which becomes
+    the bottleneck before the network does once fetch_batch has hundreds
+    of sockets in flight. Call this once at startup, before any event
+    loop is created.
+
+    Returns:
+        True if uvloop was installed, False if it isn't available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.warning("uvloop is not installed; keeping the default event loop")
+        return False
+    uvloop.install()
+    logger.info("uvloop installed as the event loop policy")
+    return True
+
+
+def _iter_json_files(root: str, recursive: bool):
+    """
+    Yield paths of .json files under root using os.scandir.
+
+    DirEntry caches the file type from the directory read, so this avoids
+    the per-entry stat calls Path.glob pays on large trees.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        yield from _iter_json_files(entry.path, recursive)
+                elif entry.name.endswith(".json") and entry.is_file(
+                    follow_symlinks=False
+                ):
+                    yield entry.path
+            except OSError:
+                continue
+
 
 class AsyncCLIPFetchError(Exception):
     """Custom exception for async CLIP fetching errors."""
@@ -34,6 +143,10 @@ class AsyncCLIPFetcher:
     - Cache statistics and management
     - Support for batch operations
     - Configurable cache policies
+
+    For batch-heavy workloads the event loop itself can become the
+    bottleneck; call install_uvloop() once at startup to opt in to a
+    faster loop when uvloop is installed.
     """
 
     def __init__(
@@ -44,6 +157,11 @@ class AsyncCLIPFetcher:
         cache_enabled: bool = True,
         cache_max_age: int = 3600,
         user_agent: str = "CLIP-SDK-Python-Async/0.1.0",
+        max_concurrent: int = 10,
+        warmup_url: Optional[str] = None,
+        cache_eviction: str = "lru",
+        max_response_bytes: int = 50 * 1024 * 1024,
+        adaptive_concurrency: bool = False,
     ):
         """
         Initialize the async CLIP fetcher with advanced caching.
@@ -55,11 +173,46 @@ class AsyncCLIPFetcher:
             cache_enabled: Whether to enable caching
             cache_max_age: Default cache max age in seconds
             user_agent: User agent string for HTTP requests
+            max_concurrent: Maximum number of concurrent HTTP requests
+            warmup_url: URL to pre-open pooled connections against when
+                the fetcher is entered as an async context manager
+            cache_eviction: Memory eviction policy for the default cache
+                ("lru", "2-random", or "fifo"); LRU suits prefetch-heavy
+                workloads where fresh entries dominate
+            max_response_bytes: Maximum response body size to accept;
+                larger responses abort the fetch instead of buffering
+            adaptive_concurrency: Adjust max_concurrent between batches
+                with additive-increase/multiplicative-decrease: grow when
+                a batch window saw no connection errors, halve when it did
         """
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.max_retries = max_retries
         self.cache_enabled = cache_enabled
         self.user_agent = user_agent
+        self.max_concurrent = max_concurrent
+        self.warmup_url = warmup_url
+        self.max_response_bytes = max_response_bytes
+        # Built once and installed on the shared session so aiohttp skips
+        # the per-request header merge in tight batch loops.
+        self._default_headers = {
+            "Accept": "application/json",
+            "User-Agent": self.user_agent,
+        }
+
+        # Semaphore gating the actual HTTP sends; created lazily so the
+        # fetcher can be constructed outside a running event loop.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_key: Optional[tuple] = None
+
+        # Shared HTTP session so repeated fetches reuse pooled connections
+        # instead of paying TCP+TLS setup per request. Created lazily for
+        # the same reason as the semaphore.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_limit: Optional[int] = None
+        # Sessions superseded by a concurrency-limit change; they may still
+        # serve in-flight requests and are closed in close().
+        self._stale_sessions: List[aiohttp.ClientSession] = []
 
         # Initialize cache
         if cache_enabled:
@@ -70,17 +223,162 @@ class AsyncCLIPFetcher:
                     max_age=cache_max_age,
                     max_memory_entries=1000,
                     max_disk_size_mb=100,
+                    eviction=cache_eviction,
                 )
             else:
                 self.cache = cache
         else:
             self.cache = None
 
+        # Dedicated executor for blocking file I/O so it doesn't contend
+        # with other users of the loop's default thread pool; sized to the
+        # request concurrency limit. Created lazily on first use.
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # In-flight request coalescing: concurrent fetches of the same URL
+        # share one HTTP request instead of issuing duplicates.
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._inflight_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # AIMD concurrency control: per-batch windows of successes and
+        # connection errors drive max_concurrent up or down between
+        # batches when adaptive_concurrency is enabled. A fixed limit is
+        # either too low for fast origins or high enough to trigger
+        # connector/DNS error storms; this tracks the widest limit the
+        # origin actually sustains.
+        self.adaptive_concurrency = adaptive_concurrency
+        self._adaptive_cap = max_concurrent * 4
+        self._window_successes = 0
+        self._window_conn_errors = 0
+
+        # Validation memo for cache hits: maps id(obj) -> obj for payloads
+        # that already passed _is_valid_clip_structure. Holding the object
+        # itself keeps its id() stable, so a recycled address can never
+        # alias a stale entry. Bounded; cleared wholesale when full since
+        # re-validation is cheap.
+        self._validated_objects: Dict[int, Any] = {}
+
         # Failed sources tracking
         self._failed_sources: List[Dict[str, str]] = []
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the request semaphore for the running loop, creating it lazily."""
+        loop = asyncio.get_running_loop()
+        key = (loop, self.max_concurrent)
+        if self._semaphore is None or self._semaphore_key != key:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphore_key = key
+        return self._semaphore
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session for the running loop, creating it lazily.
+
+        The connector is sized to max_concurrent, matching the request
+        semaphore, so the socket pool and the concurrency gate can't drift
+        apart. If the limit changes the session is rebuilt; the old one is
+        kept until close() so in-flight requests finish undisturbed.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+            or self._session_limit != self.max_concurrent
+        ):
+            if (
+                self._session is not None
+                and not self._session.closed
+                and self._session_loop is loop
+            ):
+                self._stale_sessions.append(self._session)
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrent,
+                limit_per_host=self.max_concurrent,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=connector,
+                headers=self._default_headers,
+            )
+            self._session_loop = loop
+            self._session_limit = self.max_concurrent
+        return self._session
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the dedicated file I/O executor, creating it lazily."""
+        if self._executor is None:
+            # Sized for blocking I/O rather than the HTTP limit: threads
+            # mostly wait on disk, so oversubscribe the cores but stay
+            # bounded to avoid paying for idle stacks.
+            self._executor = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 4),
+                thread_name_prefix="clip-io",
+            )
+        return self._executor
+
+    async def close(self) -> None:
+        """Close the shared HTTP session and release pooled resources."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+        self._session_limit = None
+        for session in self._stale_sessions:
+            if not session.closed:
+                await session.close()
+        self._stale_sessions = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def warmup(
+        self, url: Optional[str] = None, connections: Optional[int] = None
+    ) -> None:
+        """
+        Pre-open pooled connections by issuing concurrent HEAD requests.
+
+        Without this, the first batch against a host pays one TCP/TLS
+        handshake per pooled connection. Warm-up is best effort and
+        ignores request failures.
+
+        Args:
+            url: URL to warm against (defaults to the configured warmup_url)
+            connections: Number of connections to open (defaults to
+                max_concurrent)
+        """
+        target = url or self.warmup_url
+        if not target:
+            return
+
+        session = self._get_session()
+        count = connections or self.max_concurrent
+
+        async def open_one() -> None:
+            try:
+                async with session.head(target) as response:
+                    await response.read()
+            except aiohttp.ClientError:
+                pass
+
+        await asyncio.gather(*(open_one() for _ in range(count)))
+        logger.debug(f"Warmed up {count} connections against {target}")
+
+    async def __aenter__(self) -> "AsyncCLIPFetcher":
+        if self.warmup_url:
+            await self.warmup()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
     async def fetch(
-        self, source: str, use_cache: bool = True, validate: bool = True
+        self,
+        source: str,
+        use_cache: bool = True,
+        validate: bool = True,
+        source_type: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         Asynchronously fetch a CLIP object from a source (URL or file path).
@@ -89,6 +387,9 @@ class AsyncCLIPFetcher:
             source: URL or file path to fetch from
             use_cache: Whether to use caching for this request
             validate: Whether to validate basic CLIP structure
+            source_type: "url" or "file" when the caller already knows the
+                source kind, skipping per-source classification (None to
+                autodetect)
 
         Returns:
             The fetched CLIP object
@@ -96,7 +397,7 @@ class AsyncCLIPFetcher:
         Raises:
             AsyncCLIPFetchError: If fetching fails
         """
-        if self._is_url(source):
+        if source_type == "url" or (source_type is None and self._is_url(source)):
             return await self.fetch_from_url(
                 source, use_cache=use_cache, validate=validate
             )
@@ -124,7 +425,7 @@ class AsyncCLIPFetcher:
         if self.cache_enabled and use_cache and self.cache:
             cached_object = self.cache.get(url)
             if cached_object is not None:
-                if not validate or self._is_valid_clip_structure(cached_object):
+                if not validate or self._is_validated_cached(cached_object):
                     logger.debug(f"Cache hit for URL: {url}")
                     return cached_object
                 else:
@@ -132,18 +433,105 @@ class AsyncCLIPFetcher:
                         f"Cached object for {url} failed validation, refetching"
                     )
 
+        return await self._fetch_url_nocache_check(url, use_cache, validate)
+
+    async def _fetch_url_nocache_check(
+        self, url: str, use_cache: bool, validate: bool
+    ) -> Dict[str, Any]:
+        """
+        Fetch a URL, skipping the opening cache probe.
+
+        For callers like prefetch_urls that already partitioned their URLs
+        against the cache, re-probing here would double the cache lookups
+        (and lock traffic) per miss. In-flight coalescing still applies.
+        """
+        # Coalesce with an identical request that is already in flight so a
+        # burst of fetches for one URL costs a single HTTP round trip.
+        loop = asyncio.get_running_loop()
+        if self._inflight_loop is not loop:
+            self._inflight = {}
+            self._inflight_loop = loop
+
+        key = (url, validate)
+        existing = self._inflight.get(key)
+        if existing is not None:
+            logger.debug(f"Coalescing request for in-flight URL: {url}")
+            return await existing
+
+        task = loop.create_task(
+            self._fetch_from_url_uncoalesced(url, use_cache, validate)
+        )
+        self._inflight[key] = task
+        try:
+            return await task
+        finally:
+            self._inflight.pop(key, None)
+
+    def _retry_delay(self, attempt: int, exc: Exception) -> float:
+        """
+        Compute the backoff delay before the next retry attempt.
+
+        Honors a numeric Retry-After header when the server sent one;
+        otherwise uses capped exponential backoff with full jitter so
+        concurrent retries against one origin don't arrive in lockstep.
+        """
+        headers = getattr(exc, "headers", None)
+        retry_after = headers.get("Retry-After") if headers else None
+        if retry_after:
+            try:
+                return min(_RETRY_CAP_SECONDS, float(retry_after))
+            except ValueError:
+                pass
+        return random.uniform(0, min(_RETRY_CAP_SECONDS, 0.5 * (2**attempt)))
+
+    async def _read_body_guarded(self, url: str, response) -> bytes:
+        """
+        Read a response body in chunks, enforcing max_response_bytes.
+
+        Bounds memory per in-flight request: a misconfigured or hostile
+        server can't balloon a batch by streaming an arbitrarily large
+        body into one buffered read.
+        """
+        content_length = response.headers.get("Content-Length")
+        if content_length:
+            try:
+                if int(content_length) > self.max_response_bytes:
+                    raise AsyncCLIPFetchError(
+                        f"Response from {url} exceeds "
+                        f"{self.max_response_bytes} byte limit"
+                    )
+            except ValueError:
+                pass
+
+        buf = bytearray()
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            buf.extend(chunk)
+            if len(buf) > self.max_response_bytes:
+                raise AsyncCLIPFetchError(
+                    f"Response from {url} exceeds "
+                    f"{self.max_response_bytes} byte limit"
+                )
+        return bytes(buf)
+
+    async def _fetch_from_url_uncoalesced(
+        self, url: str, use_cache: bool, validate: bool
+    ) -> Dict[str, Any]:
+        """Perform the actual HTTP fetch for a URL, with retries."""
         # Fetch from URL with retries
         last_exception = None
         for attempt in range(self.max_retries):
             try:
-                headers = {"Accept": "application/json", "User-Agent": self.user_agent}
-
-                async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                    async with session.get(url, headers=headers) as response:
+                # Gate the actual HTTP send so concurrency is bounded at the
+                # request boundary, not just around batch bookkeeping.
+                # Headers ride on the session (see _get_session).
+                async with self._get_semaphore():
+                    session = self._get_session()
+                    async with session.get(url) as response:
                         response.raise_for_status()
 
-                        # Parse JSON
-                        clip_object = await response.json()
+                        # Parse JSON from raw bytes (orjson when available)
+                        body = await self._read_body_guarded(url, response)
+                        clip_object = _json.loads(body)
 
                         # Validate basic CLIP structure if requested
                         if validate:
@@ -151,36 +539,45 @@ class AsyncCLIPFetcher:
 
                         # Cache if enabled
                         if self.cache_enabled and use_cache and self.cache:
-                            # Extract cache headers
-                            http_headers = dict(response.headers)
+                            # The cache only .get()s Cache-Control/Expires,
+                            # so pass the header multidict without copying
                             self.cache.set(
-                                url, clip_object, from_http_headers=http_headers
+                                url,
+                                clip_object,
+                                from_http_headers=response.headers,
                             )
 
                         logger.info(f"Successfully fetched CLIP object from: {url}")
+                        self._window_successes += 1
                         return clip_object
 
-            except (aiohttp.ClientError, json.JSONDecodeError, ValueError) as e:
+            except (json.JSONDecodeError, ValueError) as e:
+                # Malformed body or invalid CLIP structure on a delivered
+                # response; retrying would just re-download the same document
                 last_exception = e
-                if attempt < self.max_retries - 1:
-                    try:
-                        error_msg = str(e)
-                    except Exception:
-                        error_msg = repr(e)
-                    logger.warning(
-                        f"Attempt {attempt + 1} failed for {url}: "
-                        f"{error_msg}. Retrying..."
-                    )
-                    await asyncio.sleep(1)  # Brief delay before retry
-                else:
+                logger.error(f"Unusable response from {url}: {e}")
+                break
+
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                last_exception = e
+                if isinstance(e, aiohttp.ClientConnectorError):
+                    self._window_conn_errors += 1
+                status = getattr(e, "status", None)
+                if status is not None and status not in _RETRYABLE_STATUSES:
+                    logger.error(f"Non-retryable HTTP {status} for {url}")
+                    break
+                if attempt >= self.max_retries - 1:
                     logger.error(f"All {self.max_retries} attempts failed for {url}")
+                    break
+                delay = self._retry_delay(attempt, e)
+                logger.warning(
+                    f"Attempt {attempt + 1} failed for {url}: "
+                    f"{_exc_message(e)}. Retrying in {delay:.2f}s..."
+                )
+                await asyncio.sleep(delay)
 
-        try:
-            error_msg = str(last_exception)
-        except Exception:
-            error_msg = repr(last_exception)
         raise AsyncCLIPFetchError(
-            f"Failed to fetch CLIP object from {url}: {error_msg}"
+            f"Failed to fetch CLIP object from {url}: {_exc_message(last_exception)}"
         )
 
     async def fetch_from_file(
@@ -200,10 +597,14 @@ class AsyncCLIPFetcher:
             AsyncCLIPFetchError: If fetching fails
         """
         try:
-            # Run file I/O in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            # Read and parse in the executor so neither disk I/O nor JSON
+            # decoding of large files blocks the event loop
+            def _read_and_parse() -> Dict[str, Any]:
+                return _json.loads(Path(file_path).read_bytes())
+
+            loop = asyncio.get_running_loop()
             clip_object = await loop.run_in_executor(
-                None, load_json_from_path, file_path
+                self._get_executor(), _read_and_parse
             )
 
             if validate:
@@ -222,7 +623,8 @@ class AsyncCLIPFetcher:
         sources: List[str],
         use_cache: bool = True,
         validate: bool = True,
-        max_concurrent: int = 10,
+        max_concurrent: Optional[int] = None,
+        source_type: Optional[str] = None,
     ) -> List[Union[Dict[str, Any], Exception]]:
         """
         Asynchronously fetch multiple CLIP objects from a list of sources.
@@ -232,6 +634,9 @@ class AsyncCLIPFetcher:
             use_cache: Whether to use caching for requests
             validate: Whether to validate basic CLIP structure
             max_concurrent: Maximum number of concurrent requests
+                (None to keep the fetcher's configured limit)
+            source_type: "url" or "file" when every source is of one known
+                kind, so dispatch skips per-source classification
 
         Returns:
             List of fetched CLIP objects or exceptions for failed fetches
@@ -240,22 +645,74 @@ class AsyncCLIPFetcher:
             This method returns results for all sources, with exceptions
             for failed fetches. Use return_exceptions=True behavior.
         """
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def fetch_with_semaphore(source: str) -> Union[Dict[str, Any], Exception]:
-            async with semaphore:
-                try:
-                    return await self.fetch(
-                        source, use_cache=use_cache, validate=validate
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to fetch from {source}: {str(e)}")
-                    return e
+        # Concurrency is enforced by the fetcher-level semaphore at the
+        # HTTP request boundary (see fetch_from_url); here we only adjust
+        # the configured limit for this batch if the caller asked for one.
+        if max_concurrent is not None:
+            self.max_concurrent = max_concurrent
+
+        # Resolve warm-cache hits up front in one batched lookup so they
+        # never touch the task machinery at all.
+        cache_hits: Dict[str, Any] = {}
+        if self.cache_enabled and use_cache and self.cache and source_type != "file":
+            if source_type == "url":
+                candidates = sources
+            else:
+                candidates = [s for s in sources if self._is_url(s)]
+            cache_hits = self.cache.get_many(candidates)
+            if validate:
+                cache_hits = {
+                    key: value
+                    for key, value in cache_hits.items()
+                    if self._is_validated_cached(value)
+                }
+
+        # Warm-cache hits were validated in the partition above, so only
+        # misses pay for validation — and they must validate inside the
+        # fetch itself, so an invalid fresh body is rejected before it
+        # is ever written to the cache, and a poisoned cached entry is
+        # refetched from the origin exactly as the single-fetch path does.
+        async def fetch_one(source: str) -> Union[Dict[str, Any], Exception]:
+            try:
+                return await self.fetch(
+                    source,
+                    use_cache=use_cache,
+                    validate=validate,
+                    source_type=source_type,
+                )
+            except Exception as e:
+                logger.error(f"Failed to fetch from {source}: {str(e)}")
+                return e
+
+        # Execute all fetches concurrently. Each coroutine catches its own
+        # exceptions, so the group never aborts siblings on a single failure.
+        loop = asyncio.get_running_loop()
+        if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+            # Python 3.12+: eagerly started tasks let cache-hit fetches
+            # complete without an extra event loop round trip.
+            loop.set_task_factory(asyncio.eager_task_factory)
+
+        # Schedule one task per distinct miss; a source repeated in the
+        # batch shares that task's result rather than spawning siblings
+        # that would only coalesce at the HTTP layer anyway.
+        misses = list(dict.fromkeys(s for s in sources if s not in cache_hits))
+        if hasattr(asyncio, "TaskGroup"):
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(fetch_one(source)) for source in misses]
+            miss_results = [task.result() for task in tasks]
+        else:
+            # Python < 3.11 fallback
+            miss_results = await asyncio.gather(
+                *(fetch_one(source) for source in misses),
+                return_exceptions=True,
+            )
 
-        # Execute all fetches concurrently
-        tasks = [fetch_with_semaphore(source) for source in sources]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Reassemble results in source order
+        miss_map = dict(zip(misses, miss_results))
+        results = [
+            cache_hits[source] if source in cache_hits else miss_map[source]
+            for source in sources
+        ]
 
         # Track failed sources
         self._failed_sources = []
@@ -270,23 +727,129 @@ class AsyncCLIPFetcher:
             f"Batch fetch completed: {successful_count}/{len(sources)} successful"
         )
 
+        if self.adaptive_concurrency:
+            self._adjust_concurrency()
+
         return results
 
+    def _adjust_concurrency(self) -> None:
+        """
+        Apply one AIMD step to max_concurrent from the last batch window.
+
+        Any connection error halves the limit (floor 4); a clean window
+        that actually saturated the limit grows it by 4 up to the cap.
+        The semaphore and session are keyed on max_concurrent, so the new
+        limit takes effect on the next request.
+        """
+        successes = self._window_successes
+        errors = self._window_conn_errors
+        self._window_successes = 0
+        self._window_conn_errors = 0
+
+        limit = self.max_concurrent
+        if errors > 0:
+            limit = max(limit // 2, 4)
+        elif successes > limit:
+            limit = min(limit + 4, self._adaptive_cap)
+
+        if limit != self.max_concurrent:
+            logger.info(
+                f"Adaptive concurrency: {self.max_concurrent} -> {limit} "
+                f"({successes} ok, {errors} connection errors in window)"
+            )
+            self.max_concurrent = limit
+
+    def get_adaptive_stats(self) -> Dict[str, Any]:
+        """
+        Get the current state of the adaptive concurrency controller.
+
+        Returns:
+            Dictionary with the active limit, cap, and current window counts
+        """
+        return {
+            "enabled": self.adaptive_concurrency,
+            "current_limit": self.max_concurrent,
+            "max_limit": self._adaptive_cap,
+            "window_successes": self._window_successes,
+            "window_connection_errors": self._window_conn_errors,
+        }
+
+    async def iter_multiple(
+        self,
+        sources: List[str],
+        use_cache: bool = True,
+        validate: bool = True,
+        max_concurrent: Optional[int] = None,
+        source_type: Optional[str] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Asynchronously fetch multiple CLIP objects, yielding each success
+        as soon as it completes.
+
+        Unlike fetch_batch, results are never materialized in one list, so
+        peak memory stays flat for large batches and consumers can start
+        processing before the slowest source finishes. Yield order follows
+        completion order, not source order.
+
+        Args:
+            sources: List of URLs or file paths
+            use_cache: Whether to use caching for requests
+            validate: Whether to validate basic CLIP structure
+            max_concurrent: Maximum number of concurrent requests
+                (None to keep the fetcher's configured limit)
+            source_type: "url" or "file" when every source is of one known
+                kind (see fetch_batch)
+
+        Yields:
+            Successfully fetched CLIP objects, in completion order
+
+        Note:
+            Failed fetches are logged but don't stop the process.
+            Use get_failed_sources() to check for failures.
+        """
+        if max_concurrent is not None:
+            self.max_concurrent = max_concurrent
+
+        self._failed_sources = []
+
+        async def fetch_one(source: str) -> Optional[Dict[str, Any]]:
+            try:
+                return await self.fetch(
+                    source,
+                    use_cache=use_cache,
+                    validate=validate,
+                    source_type=source_type,
+                )
+            except Exception as e:
+                logger.error(f"Failed to fetch from {source}: {str(e)}")
+                self._failed_sources.append({"source": source, "error": str(e)})
+                return None
+
+        tasks = [asyncio.ensure_future(fetch_one(source)) for source in sources]
+        for completed in asyncio.as_completed(tasks):
+            result = await completed
+            if result is not None:
+                yield result
+
     async def fetch_multiple(
         self,
         sources: List[str],
         use_cache: bool = True,
         validate: bool = True,
-        max_concurrent: int = 10,
+        max_concurrent: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Asynchronously fetch multiple CLIP objects, returning only successful results.
 
+        Thin wrapper over iter_multiple; prefer the streaming API when
+        batches are large or results can be consumed incrementally.
+
         Args:
             sources: List of URLs or file paths
             use_cache: Whether to use caching for requests
             validate: Whether to validate basic CLIP structure
             max_concurrent: Maximum number of concurrent requests
+                (None to keep the fetcher's configured limit)
 
         Returns:
             List of successfully fetched CLIP objects
@@ -295,15 +858,13 @@ class AsyncCLIPFetcher:
             Failed fetches are logged but don't stop the process.
             Use get_failed_sources() to check for failures.
         """
-        results = await self.fetch_batch(sources, use_cache, validate, max_concurrent)
-
-        # Filter out exceptions and return only successful results
-        successful_results = [
-            result for result in results if not isinstance(result, Exception)
+        return [
+            result
+            async for result in self.iter_multiple(
+                sources, use_cache, validate, max_concurrent
+            )
         ]
 
-        return successful_results
-
     def get_failed_sources(self) -> List[Dict[str, str]]:
         """
         Get list of sources that failed during the last batch operation.
@@ -331,28 +892,34 @@ class AsyncCLIPFetcher:
             raise AsyncCLIPFetchError(f"Directory does not exist: {directory}")
 
         # Run directory traversal in executor
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
 
         def _discover_files():
-            pattern = "**/*.json" if recursive else "*.json"
-            json_files = list(directory_path.glob(pattern))
-
             # Filter to only include likely CLIP files
             clip_files = []
-            for file_path in json_files:
+            for file_path in _iter_json_files(str(directory_path), recursive):
                 try:
-                    # Quick check for CLIP structure
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        if self._is_likely_clip_object(data):
-                            clip_files.append(str(file_path))
+                    # Cheap substring prefilter; only candidates pay for
+                    # a full JSON parse. The head scan is only decisive
+                    # when the head is the whole file — markers in larger
+                    # files may sit past (or straddle) the boundary, so
+                    # those get scanned in full.
+                    with open(file_path, "rb") as f:
+                        raw = f.read(_PREFILTER_HEAD_BYTES)
+                        if len(raw) == _PREFILTER_HEAD_BYTES:
+                            raw += f.read()
+                        if not any(marker in raw for marker in _CLIP_MARKERS):
+                            continue
+                        data = _json.loads(raw)
+                    if self._is_likely_clip_object(data):
+                        clip_files.append(file_path)
                 except (json.JSONDecodeError, IOError):
                     # Skip files that can't be read as JSON
                     continue
 
             return clip_files
 
-        clip_files = await loop.run_in_executor(None, _discover_files)
+        clip_files = await loop.run_in_executor(self._get_executor(), _discover_files)
 
         logger.info(f"Discovered {len(clip_files)} potential CLIP files in {directory}")
         return clip_files
@@ -403,8 +970,26 @@ class AsyncCLIPFetcher:
         else:
             logger.warning("Cache is not enabled")
 
+    def set_cache_eviction(self, policy: str) -> None:
+        """
+        Set the memory eviction policy for the cache.
+
+        Args:
+            policy: One of "lru", "2-random", or "fifo"
+        """
+        if self.cache_enabled and self.cache:
+            if policy not in ("lru", "2-random", "fifo"):
+                raise ValueError(f"Unknown eviction policy: {policy}")
+            self.cache.eviction = policy
+            logger.info(f"Set cache eviction policy to: {policy}")
+        else:
+            logger.warning("Cache is not enabled")
+
     async def prefetch_urls(
-        self, urls: List[str], use_cache: bool = True, max_concurrent: int = 10
+        self,
+        urls: List[str],
+        use_cache: bool = True,
+        max_concurrent: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Asynchronously prefetch multiple URLs and store in cache.
@@ -413,6 +998,7 @@ class AsyncCLIPFetcher:
             urls: List of URLs to prefetch
             use_cache: Whether to use/store in cache
             max_concurrent: Maximum number of concurrent requests
+                (None to keep the fetcher's configured limit)
 
         Returns:
             Dictionary with prefetch results
@@ -423,11 +1009,17 @@ class AsyncCLIPFetcher:
 
         results = {"successful": [], "failed": [], "cached": [], "total_time": 0}
 
-        # Check cache first
+        # Partition against the cache in one batched lookup; the misses
+        # then go through _fetch_url_nocache_check so the cache isn't
+        # probed a second time per URL inside the fetch path.
         urls_to_fetch = []
         if self.cache_enabled and use_cache and self.cache:
+            # get_many only consults the memory tier, so probe the disk
+            # tier for its misses; prefetching after a restart should
+            # find the warm disk cache, not re-download everything
+            hits = self.cache.get_many(urls)
             for url in urls:
-                if self.cache.get(url) is not None:
+                if url in hits or self.cache.get(url) is not None:
                     results["cached"].append(url)
                 else:
                     urls_to_fetch.append(url)
@@ -436,15 +1028,28 @@ class AsyncCLIPFetcher:
 
         # Fetch remaining URLs
         if urls_to_fetch:
-            fetch_results = await self.fetch_batch(
-                urls_to_fetch, use_cache=use_cache, max_concurrent=max_concurrent
+            if max_concurrent is not None:
+                self.max_concurrent = max_concurrent
+
+            async def fetch_one(url: str) -> Union[Dict[str, Any], Exception]:
+                try:
+                    return await self._fetch_url_nocache_check(url, use_cache, True)
+                except Exception as e:
+                    return e
+
+            fetch_results = await asyncio.gather(
+                *(fetch_one(url) for url in urls_to_fetch)
             )
 
+            self._failed_sources = []
             for i, result in enumerate(fetch_results):
                 if isinstance(result, Exception):
                     results["failed"].append(
                         {"url": urls_to_fetch[i], "error": str(result)}
                     )
+                    self._failed_sources.append(
+                        {"source": urls_to_fetch[i], "error": str(result)}
+                    )
                 else:
                     results["successful"].append(urls_to_fetch[i])
 
@@ -459,11 +1064,7 @@ class AsyncCLIPFetcher:
 
     def _is_url(self, source: str) -> bool:
         """Check if a source is a URL."""
-        try:
-            result = urlparse(source)
-            return bool(result.scheme and result.netloc)
-        except Exception:
-            return False
+        return _is_url(source)
 
     def _validate_basic_structure(
         self, clip_object: Dict[str, Any], source: str
@@ -472,22 +1073,35 @@ class AsyncCLIPFetcher:
         if not self._is_valid_clip_structure(clip_object):
             raise ValueError(f"Invalid CLIP object structure from {source}")
 
+    def _is_validated_cached(self, clip_object: Dict[str, Any]) -> bool:
+        """
+        Check structural validity of a cached payload, memoizing the result.
+
+        Cached objects are not mutated by the fetcher, so a payload that
+        validated once stays valid; repeat cache hits then skip the
+        dict-key scans entirely.
+        """
+        if id(clip_object) in self._validated_objects:
+            return True
+        if self._is_valid_clip_structure(clip_object):
+            if len(self._validated_objects) >= 1024:
+                self._validated_objects.clear()
+            self._validated_objects[id(clip_object)] = clip_object
+            return True
+        return False
+
     def _is_valid_clip_structure(self, clip_object: Dict[str, Any]) -> bool:
         """Check if object has valid CLIP structure."""
         if not isinstance(clip_object, dict):
             return False
 
-        # Check for required fields
-        required_fields = ["@context", "type", "id"]
-        if not all(field in clip_object for field in required_fields):
+        # Single C-level subset check for the required fields
+        if not _REQUIRED_FIELDS <= clip_object.keys():
             return False
 
         # Check for valid CLIP context
         context = clip_object.get("@context")
-        if not isinstance(context, str) or "clipprotocol.org" not in context:
-            return False
-
-        return True
+        return isinstance(context, str) and _CONTEXT_MARKER in context
 
     def _is_likely_clip_object(self, data: Dict[str, Any]) -> bool:
         """Quick check to see if a JSON object is likely a CLIP object."""
@@ -496,10 +1110,9 @@ class AsyncCLIPFetcher:
 
         # Check for CLIP indicators
         context = data.get("@context", "")
-        has_clip_context = isinstance(context, str) and "clipprotocol.org" in context
-        has_clip_type = data.get("type") in ["Venue", "Device", "SoftwareApp"]
-        has_clip_id = isinstance(data.get("id"), str) and data.get("id", "").startswith(
-            "clip:"
-        )
-
-        return has_clip_context or has_clip_type or has_clip_id
+        if isinstance(context, str) and _CONTEXT_MARKER in context:
+            return True
+        if data.get("type") in _CLIP_TYPES:
+            return True
+        clip_id = data.get("id")
+        return isinstance(clip_id, str) and clip_id.startswith("clip:")
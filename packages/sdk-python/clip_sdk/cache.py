@@ -5,22 +5,192 @@ Provides caching functionality for CLIP objects with both memory and disk storag
 HTTP cache header support, and configurable expiration policies.
 """
 
+import array
 import hashlib
+import heapq
 import json
 import logging
 import os
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from . import _json
+
+try:
+    import msgpack as _msgpack
+except ImportError:  # pragma: no cover - exercised when msgpack is absent
+    _msgpack = None
+
 logger = logging.getLogger(__name__)
 
+# Number of lock shards for the in-memory cache. Sharding by key hash keeps
+# concurrent fetches for different URLs from contending on a single lock.
+_SHARD_COUNT = 16
+
+# Memory eviction policies supported by CLIPCache
+_EVICTION_POLICIES = ("lru", "2-random", "fifo")
+
+# Optional admission policies layered on top of eviction. "tinylfu"
+# tracks access frequency in a count-min sketch and only lets a new key
+# displace the eviction victim if the newcomer is accessed at least as
+# often — this beats plain LRU hit rates on Zipfian workloads with
+# occasional scans (directory discovery).
+_ADMISSION_POLICIES = ("tinylfu",)
+
+# Disk serialization formats. JSON stays the default for human-readable,
+# cross-version cache files; msgpack trades that for smaller files and
+# faster decode when the optional dependency is installed. Pickle is
+# deliberately not offered: loading it from a shared cache directory
+# would execute arbitrary code.
+_SERIALIZERS = ("json", "msgpack")
+
+# Disk write durability modes: "async" leaves flushing to the OS page
+# cache (fast), "sync" fsyncs every file before the rename (survives
+# power loss at the cost of a syscall per write)
+_DURABILITY_MODES = ("async", "sync")
+
+# Cache-Control directives that affect entry lifetime
+_CACHE_CONTROL_RE = re.compile(r"(?:^|,)\s*(?:(no-cache|no-store)|max-age=(\d+))")
+
+# Dirty disk writes are flushed once this many entries are pending, or when
+# a write arrives after this many seconds since the last flush
+_FLUSH_BATCH = 8
+_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Symbolic indices into CLIPCache._stat_counts. A C-level int array bump
+# replaces a dict lookup plus boxed-int rebind on every get/set; the
+# user-facing stats dict is rebuilt on demand in get_stats().
+_STAT_HITS = 0
+_STAT_MISSES = 1
+_STAT_MEMORY_HITS = 2
+_STAT_DISK_HITS = 3
+_STAT_EVICTIONS = 4
+_STAT_ERRORS = 5
+
+
+@lru_cache(maxsize=256)
+def _parse_cache_control(header: str) -> Optional[int]:
+    """
+    Parse a lowercased Cache-Control header into an effective max age.
+
+    Returns 0 for no-cache/no-store, the max-age value in seconds when
+    present, or None when the header says nothing about lifetime. Results
+    are memoized since origins typically reuse a handful of header values.
+    """
+    max_age = None
+    for match in _CACHE_CONTROL_RE.finditer(header):
+        if match.group(1):
+            return 0
+        max_age = int(match.group(2))
+    return max_age
+
+
+@lru_cache(maxsize=256)
+def _parse_expires(header: str) -> Optional[datetime]:
+    """
+    Parse an Expires header into a datetime, memoized by header value.
+
+    Identical upstream responses repeat the same Expires string, and
+    parsedate_to_datetime is surprisingly costly per call. Returns None
+    for unparseable values.
+    """
+    try:
+        return parsedate_to_datetime(header)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _key_to_filename(key: str, suffix: str = ".json") -> str:
+    """
+    Convert a cache key to a safe on-disk filename.
+
+    blake2b is faster than md5/sha256 for short keys and a 128-bit digest
+    keeps filenames the same length as the previous md5 scheme. The suffix
+    reflects the serializer, so json and msgpack caches can share a
+    directory without misreading each other's files. Memoized: the same
+    URL keys are hashed repeatedly across get/set/clear within a
+    fetcher's lifetime.
+    """
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + suffix
+
+
+class _CountMinSketch:
+    """
+    Fixed-size count-min sketch with periodic halving decay.
+
+    Four rows of 8192 byte-wide counters (~32 KiB). Row indexes come
+    from disjoint 13-bit slices of the key's hash, so one hash() call
+    serves all rows. Counters halve once the sample window fills,
+    keeping estimates biased toward recent popularity (standard TinyLFU
+    aging).
+    """
+
+    __slots__ = ("_rows", "_mask", "_adds", "_sample_size")
+
+    _ROW_COUNT = 4
+    _WIDTH_BITS = 13
+
+    def __init__(self):
+        width = 1 << self._WIDTH_BITS
+        self._mask = width - 1
+        self._rows = [array.array("B", bytes(width)) for _ in range(self._ROW_COUNT)]
+        self._adds = 0
+        self._sample_size = width * 8
+
+    def add(self, key: str) -> None:
+        """Record one access to key."""
+        key_hash = hash(key)
+        for row_index, row in enumerate(self._rows):
+            index = (key_hash >> (self._WIDTH_BITS * row_index)) & self._mask
+            if row[index] < 255:
+                row[index] += 1
+        self._adds += 1
+        if self._adds >= self._sample_size:
+            self._halve()
+
+    def estimate(self, key: str) -> int:
+        """Estimate the access frequency of key (never underestimates)."""
+        key_hash = hash(key)
+        return min(
+            row[(key_hash >> (self._WIDTH_BITS * row_index)) & self._mask]
+            for row_index, row in enumerate(self._rows)
+        )
+
+    def _halve(self) -> None:
+        """Age all counters by halving; runs once per full sample window."""
+        self._adds //= 2
+        for row in self._rows:
+            for index in range(len(row)):
+                row[index] >>= 1
+
 
 class CacheEntry:
     """
     Represents a single cache entry with data and expiration information.
     """
 
+    # A full cache holds max_memory_entries of these; __slots__ drops the
+    # per-instance __dict__ (~100 bytes each) and makes attribute reads a
+    # fixed slot offset instead of a dict lookup
+    __slots__ = (
+        "data",
+        "expires_at",
+        "created_at",
+        "accessed_at",
+        "access_count",
+        "_created_monotonic",
+        "_expires_monotonic_ns",
+    )
+
     def __init__(self, data: Dict[str, Any], expires_at: Optional[datetime] = None):
         """
         Initialize cache entry.
@@ -29,11 +199,29 @@ class CacheEntry:
             data: The cached data (CLIP object)
             expires_at: When this entry expires (None for no expiration)
         """
+        self._reset(data, expires_at)
+
+    def _reset(self, data: Dict[str, Any], expires_at: Optional[datetime]) -> None:
+        """(Re)initialize all entry state; used by pooled reuse in CLIPCache."""
         self.data = data
         self.expires_at = expires_at
-        self.created_at = datetime.now()
-        self.accessed_at = datetime.now()
+        # One wall-clock read shared by both timestamps; datetime.now()
+        # allocates and is the costliest part of constructing an entry
+        now = datetime.now()
+        self.created_at = now
+        self.accessed_at = now
         self.access_count = 1
+        self._created_monotonic = time.monotonic()
+        # Monotonic deadline for expiry checks: immune to wall-clock jumps
+        # (NTP adjustments) and cheaper than constructing a datetime per
+        # check. The wall-clock expires_at is kept for the disk format.
+        if expires_at is not None:
+            remaining = (expires_at - self.created_at).total_seconds()
+            self._expires_monotonic_ns: Optional[int] = time.monotonic_ns() + int(
+                remaining * 1_000_000_000
+            )
+        else:
+            self._expires_monotonic_ns = None
 
     def is_expired(self) -> bool:
         """
@@ -42,9 +230,9 @@ class CacheEntry:
         Returns:
             True if expired, False otherwise
         """
-        if not self.expires_at:
+        if self._expires_monotonic_ns is None:
             return False
-        return datetime.now() > self.expires_at
+        return time.monotonic_ns() > self._expires_monotonic_ns
 
     def touch(self) -> None:
         """Update access time and increment access count."""
@@ -53,13 +241,13 @@ class CacheEntry:
 
     def age_seconds(self) -> float:
         """Get age of entry in seconds."""
-        return (datetime.now() - self.created_at).total_seconds()
+        return time.monotonic() - self._created_monotonic
 
     def time_to_expiry_seconds(self) -> Optional[float]:
         """Get seconds until expiry (None if no expiration)."""
-        if not self.expires_at:
+        if self._expires_monotonic_ns is None:
             return None
-        return (self.expires_at - datetime.now()).total_seconds()
+        return (self._expires_monotonic_ns - time.monotonic_ns()) / 1_000_000_000
 
 
 class CLIPCache:
@@ -81,6 +269,11 @@ class CLIPCache:
         max_memory_entries: int = 1000,
         max_disk_size_mb: int = 100,
         cleanup_interval_seconds: int = 3600,
+        eviction: str = "lru",
+        write_behind: bool = False,
+        serializer: str = "json",
+        durability: str = "async",
+        admission: Optional[str] = None,
     ):
         """
         Initialize the cache.
@@ -91,25 +284,106 @@ class CLIPCache:
             max_memory_entries: Maximum entries to keep in memory
             max_disk_size_mb: Maximum disk cache size in MB
             cleanup_interval_seconds: How often to run cleanup
+            eviction: Memory eviction policy: "lru" (default), "2-random"
+                (evict the older of two sampled entries, O(1)), or "fifo"
+                (evict the oldest insertion)
+            write_behind: Buffer disk writes and flush them in batches
+                instead of writing through on every set(). Faster for
+                cold-cache write bursts, but entries only become visible
+                to other cache instances after a flush()
+            serializer: Disk file format: "json" (default) or "msgpack"
+                (~30-50% smaller files and faster decode; requires the
+                msgpack package, falls back to json with a warning)
+            durability: "async" (default) lets the OS flush disk writes;
+                "sync" fsyncs each file before it is renamed into place
+            admission: None (default, admit everything) or "tinylfu"
+                (frequency-based admission: at capacity, a new key only
+                displaces the eviction victim if it is accessed at least
+                as often, improving hit rates on skewed workloads)
         """
-        self.memory_cache: Dict[str, CacheEntry] = {}
+        if eviction not in _EVICTION_POLICIES:
+            raise ValueError(f"Eviction policy must be one of: {_EVICTION_POLICIES}")
+        self.eviction = eviction
+        if serializer not in _SERIALIZERS:
+            raise ValueError(f"Serializer must be one of: {_SERIALIZERS}")
+        if serializer == "msgpack" and _msgpack is None:
+            logger.warning(
+                "msgpack serializer requested but msgpack is not installed; "
+                "falling back to json"
+            )
+            serializer = "json"
+        self.serializer = serializer
+        if serializer == "msgpack":
+            self._file_suffix = ".msgpack"
+            self._ser_loads = _msgpack.unpackb
+            self._ser_dumps = _msgpack.packb
+        else:
+            self._file_suffix = ".json"
+            self._ser_loads = _json.loads
+            self._ser_dumps = _json.dumps_bytes
+        if durability not in _DURABILITY_MODES:
+            raise ValueError(f"Durability must be one of: {_DURABILITY_MODES}")
+        self.durability = durability
+        if admission is not None and admission not in _ADMISSION_POLICIES:
+            raise ValueError(f"Admission policy must be one of: {_ADMISSION_POLICIES}")
+        self.admission = admission
+        self._sketch = _CountMinSketch() if admission == "tinylfu" else None
+        # Ordered so the LRU policy can evict the head in O(1) via
+        # popitem(last=False) instead of scanning every entry's timestamp
+        self.memory_cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._shard_locks = [threading.RLock() for _ in range(_SHARD_COUNT)]
         self.cache_dir = cache_dir
         self.max_age = max_age
         self.max_memory_entries = max_memory_entries
         self.max_disk_size_mb = max_disk_size_mb
         self.cleanup_interval_seconds = cleanup_interval_seconds
 
-        # Statistics
-        self.stats = {
-            "hits": 0,
-            "misses": 0,
-            "memory_hits": 0,
-            "disk_hits": 0,
-            "evictions": 0,
-            "errors": 0,
-        }
+        # Statistics counters, indexed by the _STAT_* constants
+        self._stat_counts = array.array("q", [0] * 6)
 
         self.last_cleanup = datetime.now()
+        # Monotonic twin of last_cleanup: the periodic check runs on every
+        # get(), so it shouldn't construct a datetime per call
+        self._last_cleanup_monotonic = time.monotonic()
+
+        # Min-heap of (expiry deadline ns, key) for expiring memory
+        # entries: the periodic sweep pops only entries that are actually
+        # due instead of scanning the whole cache. Stale heap records
+        # (key overwritten or already evicted) are skipped by re-checking
+        # the live entry on pop.
+        self._expiry_heap: list = []
+
+        # Incremental disk usage index: file -> (size, mtime), plus a
+        # running byte total. Populated lazily with one scandir pass and
+        # maintained on every write/unlink, so size-limit enforcement and
+        # get_stats stop paying a stat() per cached file.
+        self._disk_index: Dict[Path, tuple] = {}
+        self._total_disk_bytes = 0
+        self._disk_index_loaded = False
+
+        # Original-key index for pattern clears: file -> cache key, so
+        # clear(pattern) can match keys written by this instance without
+        # opening and parsing every file. Files from other instances fall
+        # back to the read-and-check path.
+        self._disk_keys: Dict[Path, str] = {}
+
+        # Free list of CacheEntry shells: a busy cache allocates and drops
+        # one entry per set/eviction, which is pure small-object churn.
+        # Evicted entries are reset and reused instead. Bounded so an idle
+        # cache doesn't pin memory.
+        self._entry_pool: list = []
+        self._entry_pool_max = max(1, max_memory_entries // 4)
+
+        # Dirty buffer for write-behind mode: set() records entries here
+        # and they are flushed in batches, so a burst of cold-cache
+        # populates pays one size-limit enforcement scan per flush instead
+        # of syscalls and a directory scan per write. Write-through mode
+        # amortizes enforcement over a counter instead.
+        self.write_behind = write_behind
+        self._dirty: Dict[str, CacheEntry] = {}
+        self._dirty_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._writes_since_size_check = 0
 
         # Create cache directory if specified
         if cache_dir:
@@ -120,6 +394,48 @@ class CLIPCache:
                 logger.warning(f"Failed to create cache directory {cache_dir}: {e}")
                 self.cache_dir = None
 
+    def _lock_for(self, key: str) -> threading.RLock:
+        """Get the shard lock guarding a given cache key."""
+        return self._shard_locks[hash(key) & (_SHARD_COUNT - 1)]
+
+    def _make_entry(
+        self, data: Dict[str, Any], expires_at: Optional[datetime]
+    ) -> CacheEntry:
+        """Get a CacheEntry, reusing a pooled shell when one is available."""
+        if self._entry_pool:
+            entry = self._entry_pool.pop()
+            entry._reset(data, expires_at)
+            return entry
+        return CacheEntry(data, expires_at)
+
+    def _recycle(self, key: str, entry: CacheEntry) -> None:
+        """
+        Return an evicted entry's shell to the pool.
+
+        Entries still referenced by the write-behind dirty buffer are left
+        alone; resetting them would corrupt the pending disk write.
+        """
+        if self._dirty and self._dirty.get(key) is entry:
+            return
+        if len(self._entry_pool) < self._entry_pool_max:
+            entry.data = None
+            self._entry_pool.append(entry)
+
+    def _touch_entry(self, key: str, entry: CacheEntry) -> None:
+        """
+        Record an access on a memory hit. Caller holds the shard lock.
+
+        Under the LRU policy recency lives in the OrderedDict position, so
+        a hit is a move_to_end plus a counter bump — no datetime allocation
+        per access. The other policies compare entry timestamps, so they
+        keep the full touch().
+        """
+        if self.eviction == "lru":
+            self.memory_cache.move_to_end(key)
+            entry.access_count += 1
+        else:
+            entry.touch()
+
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
         Get item from cache (memory first, then disk).
@@ -134,27 +450,44 @@ class CLIPCache:
         if self._should_cleanup():
             self._cleanup()
 
+        if self._sketch is not None:
+            self._sketch.add(key)
+
         # Check memory cache first
-        if key in self.memory_cache:
-            entry = self.memory_cache[key]
-            if not entry.is_expired():
-                entry.touch()
-                self.stats["hits"] += 1
-                self.stats["memory_hits"] += 1
-                logger.debug(f"Cache hit (memory): {key}")
-                return entry.data
-            else:
-                # Remove expired entry
-                del self.memory_cache[key]
-                logger.debug(f"Expired entry removed from memory: {key}")
+        with self._lock_for(key):
+            entry = self.memory_cache.get(key)
+            if entry is not None:
+                if not entry.is_expired():
+                    self._touch_entry(key, entry)
+                    self._stat_counts[_STAT_HITS] += 1
+                    self._stat_counts[_STAT_MEMORY_HITS] += 1
+                    logger.debug(f"Cache hit (memory): {key}")
+                    return entry.data
+                else:
+                    # Remove expired entry
+                    del self.memory_cache[key]
+                    self._recycle(key, entry)
+                    logger.debug(f"Expired entry removed from memory: {key}")
 
         # Check disk cache if enabled
         if self.cache_dir:
+            # A pending dirty write is the freshest disk-bound copy
+            with self._dirty_lock:
+                pending = self._dirty.get(key)
+            if pending is not None and not pending.is_expired():
+                with self._lock_for(key):
+                    if len(self.memory_cache) < self.max_memory_entries:
+                        self.memory_cache[key] = pending
+                self._stat_counts[_STAT_HITS] += 1
+                self._stat_counts[_STAT_DISK_HITS] += 1
+                logger.debug(f"Cache hit (pending disk write): {key}")
+                return pending.data
+
             cache_file = self._get_cache_file_path(key)
             if cache_file.exists():
                 try:
-                    with open(cache_file, "r", encoding="utf-8") as f:
-                        cache_data = json.load(f)
+                    with open(cache_file, "rb") as f:
+                        cache_data = self._ser_loads(f.read())
 
                     # Check expiration
                     expires_at = cache_data.get("expires_at")
@@ -162,37 +495,79 @@ class CLIPCache:
                         expires_at = datetime.fromisoformat(expires_at)
                         if datetime.now() > expires_at:
                             # Remove expired file
-                            cache_file.unlink()
+                            self._unlink_disk_file(cache_file)
                             logger.debug(f"Expired entry removed from disk: {key}")
-                            self.stats["misses"] += 1
+                            self._stat_counts[_STAT_MISSES] += 1
                             return None
 
                     # Add to memory cache for faster access
-                    entry = CacheEntry(cache_data["data"], expires_at)
+                    entry = self._make_entry(cache_data["data"], expires_at)
                     entry.access_count = cache_data.get("access_count", 1)
 
                     # Only add to memory if we have space
-                    if len(self.memory_cache) < self.max_memory_entries:
-                        self.memory_cache[key] = entry
-
-                    self.stats["hits"] += 1
-                    self.stats["disk_hits"] += 1
+                    with self._lock_for(key):
+                        if len(self.memory_cache) < self.max_memory_entries:
+                            self.memory_cache[key] = entry
+                            if entry._expires_monotonic_ns is not None:
+                                heapq.heappush(
+                                    self._expiry_heap,
+                                    (entry._expires_monotonic_ns, key),
+                                )
+
+                    self._stat_counts[_STAT_HITS] += 1
+                    self._stat_counts[_STAT_DISK_HITS] += 1
                     logger.debug(f"Cache hit (disk): {key}")
                     return entry.data
 
                 except (json.JSONDecodeError, KeyError, OSError, ValueError) as e:
                     logger.warning(f"Failed to read cache file {cache_file}: {e}")
                     # Remove invalid cache file
-                    try:
-                        cache_file.unlink()
-                    except OSError:
-                        pass
-                    self.stats["errors"] += 1
+                    self._unlink_disk_file(cache_file)
+                    self._stat_counts[_STAT_ERRORS] += 1
 
-        self.stats["misses"] += 1
+        self._stat_counts[_STAT_MISSES] += 1
         logger.debug(f"Cache miss: {key}")
         return None
 
+    def get_many(self, keys) -> Dict[str, Any]:
+        """
+        Get multiple items from the memory cache in one pass.
+
+        Keys are bucketed by lock shard so each shard lock is acquired at
+        most once per call, amortizing lock and expiry-check overhead for
+        large warm-cache batches. Only the memory cache is consulted;
+        missing keys simply don't appear in the result and can be resolved
+        through get() (which also checks disk).
+
+        Args:
+            keys: Iterable of cache keys (typically URLs)
+
+        Returns:
+            Mapping of key to cached data for unexpired memory hits
+        """
+        results: Dict[str, Any] = {}
+        buckets: Dict[int, list] = {}
+        for key in keys:
+            buckets.setdefault(hash(key) & (_SHARD_COUNT - 1), []).append(key)
+
+        for shard, shard_keys in buckets.items():
+            with self._shard_locks[shard]:
+                for key in shard_keys:
+                    entry = self.memory_cache.get(key)
+                    if entry is None:
+                        continue
+                    if entry.is_expired():
+                        del self.memory_cache[key]
+                        self._recycle(key, entry)
+                        logger.debug(f"Expired entry removed from memory: {key}")
+                        continue
+                    self._touch_entry(key, entry)
+                    self._stat_counts[_STAT_HITS] += 1
+                    self._stat_counts[_STAT_MEMORY_HITS] += 1
+                    results[key] = entry.data
+
+        return results
+
     def set(
         self,
         key: str,
@@ -221,22 +596,49 @@ class CLIPCache:
         if cache_max_age is not None:
             expires_at = datetime.now() + timedelta(seconds=cache_max_age)
 
-        # Create cache entry
-        entry = CacheEntry(data, expires_at)
+        # Create cache entry (pooled shell when available)
+        entry = self._make_entry(data, expires_at)
+
+        if self._sketch is not None:
+            self._sketch.add(key)
 
         # Store in memory (with LRU eviction if needed)
         # Only evict if we're adding a new key and at capacity
-        if (
-            key not in self.memory_cache
-            and len(self.memory_cache) >= self.max_memory_entries
-        ):
-            self._evict_lru_memory()
-
-        self.memory_cache[key] = entry
-
-        # Store on disk if enabled
+        admitted = True
+        with self._lock_for(key):
+            if (
+                key not in self.memory_cache
+                and len(self.memory_cache) >= self.max_memory_entries
+            ):
+                if self._sketch is not None and not self._admit(key):
+                    # Colder than the would-be victim: keep the resident
+                    # entry and only write the newcomer through to disk
+                    admitted = False
+                else:
+                    self._evict_memory_entry()
+
+            if admitted:
+                self.memory_cache[key] = entry
+                if self.eviction == "lru":
+                    # Re-assignment of an existing key keeps its old
+                    # position in an OrderedDict; a fresh set counts as
+                    # most recent
+                    self.memory_cache.move_to_end(key)
+
+        if admitted and entry._expires_monotonic_ns is not None:
+            heapq.heappush(self._expiry_heap, (entry._expires_monotonic_ns, key))
+
+        # Store on disk if enabled: write-behind queues for a batched
+        # flush, write-through lands the file immediately
         if self.cache_dir:
-            self._store_to_disk(key, entry)
+            if self.write_behind:
+                self._queue_disk_write(key, entry)
+            else:
+                self._store_to_disk(key, entry)
+                self._writes_since_size_check += 1
+                if self._writes_since_size_check >= _FLUSH_BATCH:
+                    self._writes_since_size_check = 0
+                    self._enforce_disk_size_limit()
 
         logger.debug(f"Cached: {key} (expires: {expires_at})")
 
@@ -252,35 +654,59 @@ class CLIPCache:
         """
         cleared = 0
 
+        # Compile the substring pattern once instead of scanning with
+        # `pattern in key` per entry
+        rx = re.compile(re.escape(pattern)) if pattern else None
+
+        # Drop matching pending disk writes so they can't be flushed back
+        # after the clear
+        with self._dirty_lock:
+            if rx is None:
+                self._dirty.clear()
+            else:
+                for key in [k for k in self._dirty if rx.search(k)]:
+                    del self._dirty[key]
+
         # Clear memory cache
-        if pattern:
-            to_remove = [k for k in self.memory_cache.keys() if pattern in k]
-            for key in to_remove:
-                del self.memory_cache[key]
-                cleared += 1
+        if rx is not None:
+            # Snapshot only the matches in one pass over the dict (no
+            # intermediate key list), then drop them with one lock
+            # acquisition per shard instead of one per key
+            victims = tuple(k for k in self.memory_cache if rx.search(k))
+            buckets: Dict[int, list] = {}
+            for key in victims:
+                buckets.setdefault(hash(key) & (_SHARD_COUNT - 1), []).append(key)
+            for shard, shard_keys in buckets.items():
+                with self._shard_locks[shard]:
+                    for key in shard_keys:
+                        if self.memory_cache.pop(key, None) is not None:
+                            cleared += 1
         else:
             cleared += len(self.memory_cache)
             self.memory_cache.clear()
 
         # Clear disk cache
         if self.cache_dir and Path(self.cache_dir).exists():
-            for cache_file in Path(self.cache_dir).glob("*.json"):
-                if pattern:
-                    # Read file to check if key matches pattern
-                    try:
-                        with open(cache_file, "r") as f:
-                            cache_data = json.load(f)
-                        original_key = cache_data.get("original_key", "")
-                        if pattern not in original_key:
+            for cache_file in Path(self.cache_dir).glob("*" + self._file_suffix):
+                if rx is not None:
+                    original_key = self._disk_keys.get(cache_file)
+                    if original_key is not None:
+                        # Known file: match against the indexed key
+                        if not rx.search(original_key):
                             continue
-                    except Exception:
-                        pass
-
-                try:
-                    cache_file.unlink()
+                    else:
+                        # Unknown file (older instance): read to check
+                        try:
+                            with open(cache_file, "rb") as f:
+                                cache_data = self._ser_loads(f.read())
+                            original_key = cache_data.get("original_key", "")
+                            if not rx.search(original_key):
+                                continue
+                        except Exception:
+                            pass
+
+                if self._unlink_disk_file(cache_file):
                     cleared += 1
-                except OSError:
-                    pass
 
         logger.info(
             f"Cleared {cleared} cache entries"
@@ -295,26 +721,26 @@ class CLIPCache:
         Returns:
             Dictionary with cache statistics
         """
-        total_requests = self.stats["hits"] + self.stats["misses"]
-        hit_rate = self.stats["hits"] / total_requests if total_requests > 0 else 0
+        counts = self._stat_counts
+        total_requests = counts[_STAT_HITS] + counts[_STAT_MISSES]
+        hit_rate = counts[_STAT_HITS] / total_requests if total_requests > 0 else 0
 
         disk_size_mb = 0
         if self.cache_dir and Path(self.cache_dir).exists():
-            disk_size_mb = sum(
-                f.stat().st_size for f in Path(self.cache_dir).glob("*.json")
-            ) / (1024 * 1024)
+            self._load_disk_index()
+            disk_size_mb = self._total_disk_bytes / (1024 * 1024)
 
         return {
             "total_requests": total_requests,
-            "hits": self.stats["hits"],
-            "misses": self.stats["misses"],
+            "hits": counts[_STAT_HITS],
+            "misses": counts[_STAT_MISSES],
             "hit_rate": hit_rate,
-            "memory_hits": self.stats["memory_hits"],
-            "disk_hits": self.stats["disk_hits"],
+            "memory_hits": counts[_STAT_MEMORY_HITS],
+            "disk_hits": counts[_STAT_DISK_HITS],
             "memory_entries": len(self.memory_cache),
             "disk_size_mb": round(disk_size_mb, 2),
-            "evictions": self.stats["evictions"],
-            "errors": self.stats["errors"],
+            "evictions": counts[_STAT_EVICTIONS],
+            "errors": counts[_STAT_ERRORS],
         }
 
     def _determine_max_age(
@@ -327,33 +753,22 @@ class CLIPCache:
 
         # Parse HTTP cache headers
         if http_headers:
-            cache_control = http_headers.get("Cache-Control", "").lower()
-
-            # Check for no-cache or no-store
-            if "no-cache" in cache_control or "no-store" in cache_control:
-                return 0  # Don't cache
-
-            # Extract max-age
-            if "max-age=" in cache_control:
-                try:
-                    max_age_match = (
-                        cache_control.split("max-age=")[1].split(",")[0].strip()
-                    )
-                    return int(max_age_match)
-                except (ValueError, IndexError):
-                    pass
+            cache_control = http_headers.get("Cache-Control", "")
+            if cache_control:
+                parsed = _parse_cache_control(cache_control.lower())
+                if parsed is not None:
+                    return parsed
 
             # Check Expires header
             expires_header = http_headers.get("Expires")
             if expires_header:
-                try:
-                    from email.utils import parsedate_to_datetime
-
-                    expires_time = parsedate_to_datetime(expires_header)
-                    age_seconds = (expires_time - datetime.now()).total_seconds()
-                    return max(0, int(age_seconds))
-                except Exception:
-                    pass
+                expires_time = _parse_expires(expires_header)
+                if expires_time is not None:
+                    try:
+                        age_seconds = (expires_time - datetime.now()).total_seconds()
+                        return max(0, int(age_seconds))
+                    except Exception:
+                        pass
 
         # Use default max_age
         return self.max_age
@@ -365,14 +780,63 @@ class CLIPCache:
 
     def _key_to_filename(self, key: str) -> str:
         """Convert cache key to safe filename."""
-        return hashlib.md5(key.encode()).hexdigest() + ".json"
+        return _key_to_filename(key, self._file_suffix)
+
+    def _queue_disk_write(self, key: str, entry: CacheEntry) -> None:
+        """
+        Record a disk-bound entry in the dirty buffer, flushing if due.
+
+        Flushes once _FLUSH_BATCH entries are pending or the last flush is
+        older than _FLUSH_INTERVAL_SECONDS, so cold-cache write bursts pay
+        one size-limit scan per batch instead of per set().
+        """
+        with self._dirty_lock:
+            self._dirty[key] = entry
+            due = (
+                len(self._dirty) >= _FLUSH_BATCH
+                or time.monotonic() - self._last_flush > _FLUSH_INTERVAL_SECONDS
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Write all pending dirty entries to disk.
+
+        Safe to call at any time; reads already consult the dirty buffer,
+        so flushing only affects when the bytes reach the filesystem.
+        """
+        if not self.cache_dir:
+            return
+
+        with self._dirty_lock:
+            pending = self._dirty
+            self._dirty = {}
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return
+
+        for key, entry in pending.items():
+            self._store_to_disk(key, entry)
+
+        # One enforcement scan for the whole batch
+        self._enforce_disk_size_limit()
 
     def _store_to_disk(self, key: str, entry: CacheEntry) -> None:
-        """Store cache entry to disk."""
+        """
+        Store a single cache entry to disk.
+
+        The payload is written to a sibling .tmp file and renamed into
+        place with os.replace, so readers (including other instances)
+        never observe a partially written file, and an interrupted write
+        can't clobber a previously valid entry.
+        """
         if not self.cache_dir:
             return
 
         cache_file = self._get_cache_file_path(key)
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
 
         try:
             cache_data = {
@@ -385,121 +849,200 @@ class CLIPCache:
                 "original_key": key,  # Store original key for pattern matching
             }
 
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(cache_data, f, separators=(",", ":"))
-
-            # Check disk size limits
-            self._enforce_disk_size_limit()
+            payload = self._ser_dumps(cache_data)
+            with open(tmp_file, "wb") as f:
+                f.write(payload)
+                if self.durability == "sync":
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, cache_file)
+            # The payload length is the file size; no stat() needed
+            self._index_disk_file(cache_file, len(payload), time.time())
+            self._disk_keys[cache_file] = key
 
         except OSError as e:
             logger.warning(f"Failed to write cache file {cache_file}: {e}")
-            self.stats["errors"] += 1
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+            self._stat_counts[_STAT_ERRORS] += 1
+
+    def _index_disk_file(self, cache_file: Path, size: int, mtime: float) -> None:
+        """Record a written file in the disk usage index."""
+        old = self._disk_index.get(cache_file)
+        if old is not None:
+            self._total_disk_bytes -= old[0]
+        self._disk_index[cache_file] = (size, mtime)
+        self._total_disk_bytes += size
+
+    def _unlink_disk_file(self, cache_file: Path) -> bool:
+        """Unlink a cache file and drop it from the disk usage index."""
+        try:
+            cache_file.unlink()
+        except OSError:
+            return False
+        old = self._disk_index.pop(cache_file, None)
+        if old is not None:
+            self._total_disk_bytes -= old[0]
+        self._disk_keys.pop(cache_file, None)
+        return True
+
+    def _load_disk_index(self) -> None:
+        """Populate the disk usage index with one scandir pass."""
+        if self._disk_index_loaded or not self.cache_dir:
+            return
+        self._disk_index_loaded = True
+        index: Dict[Path, tuple] = dict(self._disk_index)
+        total = self._total_disk_bytes
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                for dir_entry in entries:
+                    if not dir_entry.name.endswith(self._file_suffix):
+                        continue
+                    path = Path(dir_entry.path)
+                    if path in index:
+                        continue
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue
+                    index[path] = (stat.st_size, stat.st_mtime)
+                    total += stat.st_size
+        except OSError:
+            return
+        self._disk_index = index
+        self._total_disk_bytes = total
+
+    def _admit(self, key: str) -> bool:
+        """
+        TinyLFU admission check. Caller holds the shard lock.
+
+        The newcomer must be at least as frequently accessed as the
+        entry at the eviction head; estimates come from the count-min
+        sketch, so this is two hash-and-min lookups per decision.
+        """
+        try:
+            victim = next(iter(self.memory_cache))
+        except StopIteration:
+            return True
+        return self._sketch.estimate(key) >= self._sketch.estimate(victim)
 
-    def _evict_lru_memory(self) -> None:
-        """Evict least recently used entry from memory."""
+    def _evict_memory_entry(self) -> None:
+        """Evict one entry from memory according to the configured policy."""
         if not self.memory_cache:
             return
 
-        # Find LRU entry
-        lru_key = min(
-            self.memory_cache.keys(), key=lambda k: self.memory_cache[k].accessed_at
-        )
-
-        del self.memory_cache[lru_key]
-        self.stats["evictions"] += 1
-        logger.debug(f"Evicted LRU entry: {lru_key}")
+        if self.eviction == "2-random":
+            # Sample two entries and evict the staler one: O(1) per
+            # eviction vs a full scan, at a small hit-ratio cost
+            keys = random.sample(
+                list(self.memory_cache.keys()), k=min(2, len(self.memory_cache))
+            )
+            victim = min(keys, key=lambda k: self.memory_cache[k].accessed_at)
+            self._recycle(victim, self.memory_cache.pop(victim))
+        elif self.eviction == "fifo":
+            victim = min(
+                self.memory_cache.keys(), key=lambda k: self.memory_cache[k].created_at
+            )
+            self._recycle(victim, self.memory_cache.pop(victim))
+        else:
+            # LRU order is maintained by _touch_entry/set, so the least
+            # recently used entry is simply the head of the OrderedDict
+            victim, evicted = self.memory_cache.popitem(last=False)
+            self._recycle(victim, evicted)
+        self._stat_counts[_STAT_EVICTIONS] += 1
+        logger.debug(f"Evicted entry ({self.eviction}): {victim}")
 
     def _enforce_disk_size_limit(self) -> None:
         """Remove old files if disk cache exceeds size limit."""
         if not self.cache_dir:
             return
 
-        cache_dir = Path(self.cache_dir)
-        if not cache_dir.exists():
-            return
-
-        # Get all cache files with sizes and modification times
-        cache_files = []
-        total_size = 0
-
-        for cache_file in cache_dir.glob("*.json"):
-            try:
-                stat = cache_file.stat()
-                cache_files.append((cache_file, stat.st_size, stat.st_mtime))
-                total_size += stat.st_size
-            except OSError:
-                pass
+        self._load_disk_index()
 
         max_size_bytes = self.max_disk_size_mb * 1024 * 1024
+        if self._total_disk_bytes <= max_size_bytes:
+            return
 
-        if total_size > max_size_bytes:
-            # Sort by modification time (oldest first)
-            cache_files.sort(key=lambda x: x[2])
-
-            # Remove oldest files until under limit
-            for cache_file, size, _ in cache_files:
-                if total_size <= max_size_bytes:
-                    break
-
-                try:
-                    cache_file.unlink()
-                    total_size -= size
-                    logger.debug(f"Removed old cache file: {cache_file}")
-                except OSError:
-                    pass
+        # Evict oldest first; the index already has size and mtime, so no
+        # stat() calls are paid here
+        for cache_file, (size, _) in sorted(
+            self._disk_index.items(), key=lambda item: item[1][1]
+        ):
+            if self._total_disk_bytes <= max_size_bytes:
+                break
+            if self._unlink_disk_file(cache_file):
+                logger.debug(f"Removed old cache file: {cache_file}")
 
     def _should_cleanup(self) -> bool:
         """Check if it's time for periodic cleanup."""
         return (
-            datetime.now() - self.last_cleanup
-        ).total_seconds() > self.cleanup_interval_seconds
+            time.monotonic() - self._last_cleanup_monotonic
+            > self.cleanup_interval_seconds
+        )
 
     def _cleanup(self) -> None:
         """Perform periodic cleanup of expired entries."""
         self.last_cleanup = datetime.now()
-
-        # Clean memory cache
-        expired_keys = [
-            key for key, entry in self.memory_cache.items() if entry.is_expired()
-        ]
-
-        for key in expired_keys:
-            del self.memory_cache[key]
-
-        if expired_keys:
-            logger.debug(f"Cleaned up {len(expired_keys)} expired memory entries")
+        self._last_cleanup_monotonic = time.monotonic()
+
+        # Clean memory cache: pop only due deadlines off the expiry heap
+        # instead of scanning every entry. A popped key whose live entry
+        # isn't actually expired was overwritten since the push; skip it.
+        cleaned_memory = 0
+        now_ns = time.monotonic_ns()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now_ns:
+            _, key = heapq.heappop(self._expiry_heap)
+            with self._lock_for(key):
+                entry = self.memory_cache.get(key)
+                if entry is not None and entry.is_expired():
+                    del self.memory_cache[key]
+                    self._recycle(key, entry)
+                    cleaned_memory += 1
+
+        if cleaned_memory:
+            logger.debug(f"Cleaned up {cleaned_memory} expired memory entries")
 
         # Clean disk cache
         if self.cache_dir:
+            # Flush pending writes so the scan sees the full population
+            self.flush()
             cleaned_disk = 0
             cache_dir = Path(self.cache_dir)
 
-            for cache_file in cache_dir.glob("*.json"):
+            for cache_file in cache_dir.glob("*" + self._file_suffix):
                 try:
-                    with open(cache_file, "r") as f:
-                        cache_data = json.load(f)
+                    with open(cache_file, "rb") as f:
+                        cache_data = self._ser_loads(f.read())
 
                     expires_at = cache_data.get("expires_at")
                     if expires_at:
                         expires_at = datetime.fromisoformat(expires_at)
                         if datetime.now() > expires_at:
-                            cache_file.unlink()
-                            cleaned_disk += 1
+                            if self._unlink_disk_file(cache_file):
+                                cleaned_disk += 1
 
                 except (json.JSONDecodeError, KeyError, OSError, ValueError):
                     # Remove invalid files
-                    try:
-                        cache_file.unlink()
+                    if self._unlink_disk_file(cache_file):
                         cleaned_disk += 1
-                    except OSError:
-                        pass
 
             if cleaned_disk:
                 logger.debug(f"Cleaned up {cleaned_disk} expired/invalid disk entries")
 
+            self._enforce_disk_size_limit()
+
 
+@lru_cache(maxsize=None)
 def get_default_cache_dir() -> str:
-    """Get the default cache directory for the CLIP SDK."""
+    """
+    Get the default cache directory for the CLIP SDK.
+
+    Memoized: the home-directory lookup hits the filesystem/environment,
+    and this runs during every default fetcher construction. Tests can
+    reset via get_default_cache_dir.cache_clear().
+    """
     home_dir = Path.home()
     return str(home_dir / ".clip-sdk" / "cache")
 
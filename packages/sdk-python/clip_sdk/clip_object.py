@@ -2,11 +2,12 @@
 CLIP object models and manipulation.
 """
 
+import copy
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 
 class CLIPLocation(BaseModel):
@@ -16,7 +17,8 @@ class CLIPLocation(BaseModel):
     coordinates: Optional[Dict[str, float]] = None
     timezone: Optional[str] = None
 
-    @validator("coordinates")
+    @field_validator("coordinates")
+    @classmethod
     def validate_coordinates(cls, v):
         if v is not None:
             if not isinstance(v, dict):
@@ -91,29 +93,66 @@ class CLIPObject(BaseModel):
     services: Optional[List[CLIPService]] = None
     persona: Optional[CLIPPersona] = None
 
-    class Config:
-        allow_population_by_field_name = True
-
-    @validator("context")
+    # Cached __str__/__repr__ text. These depend only on the top-level
+    # type/id/name fields, so __setattr__ and the mutator methods below
+    # can invalidate them reliably. to_dict/to_json are deliberately
+    # NOT cached: nested models and lists are public and mutable
+    # (obj.features[0].name = ...), and no assignment hook sees those
+    # edits, so a dump cache would silently serve stale data.
+    _str_cache: Optional[str] = PrivateAttr(default=None)
+    _repr_cache: Optional[str] = PrivateAttr(default=None)
+
+    # (alias, attribute) pairs checked by validate_completeness. The
+    # mapping is static per class, so it's built once here instead of on
+    # every call.
+    _COMPLETENESS_FIELDS: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("@context", "context"),
+        ("type", "type"),
+        ("id", "id"),
+        ("name", "name"),
+        ("description", "description"),
+        ("lastUpdated", "lastUpdated"),
+        ("location", "location"),
+        ("features", "features"),
+        ("actions", "actions"),
+        ("services", "services"),
+        ("persona", "persona"),
+    )
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Plain field assignment (obj.name = "...") must drop the cached
+        # __str__/__repr__ text just like the mutator helpers, or both
+        # would keep showing the pre-assignment value
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._invalidate_serialization_caches()
+
+    @field_validator("context")
+    @classmethod
     def validate_context(cls, v):
         if "clipprotocol.org" not in v:
             raise ValueError("Invalid CLIP @context")
         return v
 
-    @validator("type")
+    @field_validator("type")
+    @classmethod
     def validate_type(cls, v):
         valid_types = ["Venue", "Device", "SoftwareApp"]
         if v not in valid_types:
             raise ValueError(f"Type must be one of: {valid_types}")
         return v
 
-    @validator("id")
+    @field_validator("id")
+    @classmethod
     def validate_id(cls, v):
         if not v.startswith("clip:"):
             raise ValueError('ID must start with "clip:"')
         return v
 
-    @validator("lastUpdated")
+    @field_validator("lastUpdated")
+    @classmethod
     def validate_last_updated(cls, v):
         if v is not None:
             try:
@@ -146,8 +185,9 @@ class CLIPObject(BaseModel):
         Returns:
             CLIPObject instance
         """
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+        # Parses and validates in one pass in Rust, skipping the
+        # intermediate json.loads dict entirely
+        return cls.model_validate_json(json_str)
 
     def to_dict(
         self, by_alias: bool = True, exclude_none: bool = True
@@ -162,7 +202,7 @@ class CLIPObject(BaseModel):
         Returns:
             Dictionary representation of the CLIP object
         """
-        return self.dict(by_alias=by_alias, exclude_none=exclude_none)
+        return self.model_dump(by_alias=by_alias, exclude_none=exclude_none)
 
     def to_json(
         self, by_alias: bool = True, exclude_none: bool = True, indent: int = 2
@@ -181,9 +221,15 @@ class CLIPObject(BaseModel):
         data = self.to_dict(by_alias=by_alias, exclude_none=exclude_none)
         return json.dumps(data, indent=indent, ensure_ascii=False)
 
+    def _invalidate_serialization_caches(self) -> None:
+        """Drop cached representations after a mutation."""
+        self._str_cache = None
+        self._repr_cache = None
+
     def update_timestamp(self) -> None:
         """Update the lastUpdated timestamp to current time."""
         self.lastUpdated = datetime.now(timezone.utc).isoformat()
+        self._invalidate_serialization_caches()
 
     def add_feature(self, name: str, type: str, **kwargs) -> None:
         """
@@ -199,6 +245,7 @@ class CLIPObject(BaseModel):
 
         feature = CLIPFeature(name=name, type=type, **kwargs)
         self.features.append(feature)
+        self._invalidate_serialization_caches()
 
     def add_action(self, label: str, type: str, endpoint: str, **kwargs) -> None:
         """
@@ -215,6 +262,7 @@ class CLIPObject(BaseModel):
 
         action = CLIPAction(label=label, type=type, endpoint=endpoint, **kwargs)
         self.actions.append(action)
+        self._invalidate_serialization_caches()
 
     def add_service(self, type: str, endpoint: str, **kwargs) -> None:
         """
@@ -230,6 +278,7 @@ class CLIPObject(BaseModel):
 
         service = CLIPService(type=type, endpoint=endpoint, **kwargs)
         self.services.append(service)
+        self._invalidate_serialization_caches()
 
     def set_location(
         self,
@@ -248,6 +297,7 @@ class CLIPObject(BaseModel):
         self.location = CLIPLocation(
             address=address, coordinates=coordinates, timezone=timezone
         )
+        self._invalidate_serialization_caches()
 
     def set_persona(
         self,
@@ -268,6 +318,7 @@ class CLIPObject(BaseModel):
         self.persona = CLIPPersona(
             role=role, personality=personality, expertise=expertise, prompt=prompt
         )
+        self._invalidate_serialization_caches()
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -276,6 +327,14 @@ class CLIPObject(BaseModel):
         Returns:
             Dictionary with statistics
         """
+        # Size is an estimate, so a cheap sum over set fields is enough;
+        # serializing the whole object to JSON just to measure it made
+        # stats polling O(object size)
+        estimated_size = sum(
+            len(str(value))
+            for name in type(self).model_fields
+            if (value := getattr(self, name, None)) is not None
+        )
         return {
             "type": self.type,
             "featureCount": len(self.features) if self.features else 0,
@@ -283,7 +342,7 @@ class CLIPObject(BaseModel):
             "serviceCount": len(self.services) if self.services else 0,
             "hasLocation": self.location is not None,
             "hasPersona": self.persona is not None,
-            "estimatedSize": len(self.to_json(exclude_none=True, indent=None)),
+            "estimatedSize": estimated_size,
         }
 
     def validate_completeness(self) -> Dict[str, Any]:
@@ -293,37 +352,23 @@ class CLIPObject(BaseModel):
         Returns:
             Dictionary with completeness information
         """
-        total_fields = [
-            "@context",
-            "type",
-            "id",
-            "name",
-            "description",
-            "lastUpdated",
-            "location",
-            "features",
-            "actions",
-            "services",
-            "persona",
-        ]
-
         present_fields = 0
         missing_fields = []
 
-        data = self.to_dict(by_alias=True, exclude_none=True)
-
-        for field in total_fields:
-            if field in data and data[field] is not None:
+        # Presence only needs attribute reads, not a full model dump
+        for alias, attr in self._COMPLETENESS_FIELDS:
+            if getattr(self, attr, None) is not None:
                 present_fields += 1
             else:
-                missing_fields.append(field)
+                missing_fields.append(alias)
 
-        completeness = round((present_fields / len(total_fields)) * 100)
+        total_fields = len(self._COMPLETENESS_FIELDS)
+        completeness = round((present_fields / total_fields) * 100)
 
         return {
             "completeness": completeness,
             "presentFields": present_fields,
-            "totalFields": len(total_fields),
+            "totalFields": total_fields,
             "missingFields": missing_fields,
         }
 
@@ -340,16 +385,18 @@ class CLIPObject(BaseModel):
         Returns:
             New merged CLIPObject
         """
-        if prefer_other:
-            base_data = self.to_dict(exclude_none=True)
-            other_data = other.to_dict(exclude_none=True)
-            merged_data = {**base_data, **other_data}
-        else:
-            base_data = other.to_dict(exclude_none=True)
-            other_data = self.to_dict(exclude_none=True)
-            merged_data = {**base_data, **other_data}
-
-        return CLIPObject.from_dict(merged_data)
+        # Both sides already passed validation, so the merge can patch a
+        # copy of the base instead of dumping both objects to dicts and
+        # re-running every validator on the result. Patch values are
+        # deep-copied so the merged object shares no state with either
+        # source, matching the old dict round-trip semantics.
+        base, winner = (self, other) if prefer_other else (other, self)
+        patch = {
+            name: copy.deepcopy(value)
+            for name in type(winner).model_fields
+            if (value := getattr(winner, name)) is not None
+        }
+        return base.model_copy(update=patch, deep=True)
 
     def clone(self) -> "CLIPObject":
         """
@@ -358,12 +405,26 @@ class CLIPObject(BaseModel):
         Returns:
             New CLIPObject instance
         """
-        return CLIPObject.from_dict(self.to_dict())
+        # model_copy skips validation: the source already passed it
+        return self.model_copy(deep=True)
 
     def __str__(self) -> str:
         """String representation of the CLIP object."""
-        return f"CLIPObject(type={self.type}, id={self.id}, name={self.name})"
+        # Cached alongside the serialization caches: log statements format
+        # the same unchanged object repeatedly, and each f-string pays
+        # three pydantic attribute reads
+        cached = self._str_cache
+        if cached is None:
+            cached = f"CLIPObject(type={self.type}, id={self.id}, name={self.name})"
+            self._str_cache = cached
+        return cached
 
     def __repr__(self) -> str:
         """Developer representation of the CLIP object."""
-        return f"CLIPObject(type='{self.type}', id='{self.id}', name='{self.name}')"
+        cached = self._repr_cache
+        if cached is None:
+            cached = (
+                f"CLIPObject(type='{self.type}', id='{self.id}', name='{self.name}')"
+            )
+            self._repr_cache = cached
+        return cached
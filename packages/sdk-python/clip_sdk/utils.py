@@ -6,6 +6,11 @@ import json
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from . import _json
+
+# Array-valued CLIP fields that merge rather than replace
+_ARRAY_FIELDS = ("features", "actions", "services")
+
 
 def load_json_from_path(file_path: Union[str, Path]) -> Dict[str, Any]:
     """
@@ -26,8 +31,9 @@ def load_json_from_path(file_path: Union[str, Path]) -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Parse from raw bytes (orjson when available)
+    with open(path, "rb") as f:
+        return _json.loads(f.read())
 
 
 def save_json_to_path(
@@ -46,8 +52,10 @@ def save_json_to_path(
     # Create parent directories if they don't exist
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, ensure_ascii=False)
+    # Serialize to bytes in one shot (orjson when available) instead of
+    # streaming through json.dump's text encoder
+    with open(path, "wb") as f:
+        f.write(_json.dumps_pretty(data, indent=indent))
 
 
 def is_valid_clip_id(clip_id: str) -> bool:
@@ -150,11 +158,11 @@ def get_clip_object_hash(clip_object: Dict[str, Any]) -> str:
     """
     import hashlib
 
-    # Create a stable string representation
-    stable_str = json.dumps(clip_object, sort_keys=True, separators=(",", ":"))
-
-    # Generate hash
-    return hashlib.sha256(stable_str.encode("utf-8")).hexdigest()[:16]
+    # Stays on the stdlib encoder deliberately: orjson emits raw UTF-8
+    # where json escapes non-ASCII, so hashing orjson output would make
+    # the "same" object hash differently across installs
+    canonical = json.dumps(clip_object, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
 
 
 def filter_clip_objects(
@@ -170,36 +178,46 @@ def filter_clip_objects(
     Returns:
         Filtered list of CLIP objects
     """
-    filtered = []
-
-    for obj in clip_objects:
-        matches = True
-
-        for key, value in filters.items():
+    # Compile each criterion once instead of re-dispatching on the
+    # filter value's type for every object
+    predicates = []
+    for key, value in filters.items():
+        if isinstance(value, str):
+            # String matching (case-insensitive)
+            predicates.append((key, "substr", value.lower()))
+        elif isinstance(value, list):
+            # List contains matching; frozenset gives O(1) membership
+            # when the allowed values are hashable
+            try:
+                value = frozenset(value)
+            except TypeError:
+                pass
+            predicates.append((key, "in", value))
+        else:
+            # Exact matching
+            predicates.append((key, "eq", value))
+
+    def matches(obj: Dict[str, Any]) -> bool:
+        for key, kind, value in predicates:
             if key not in obj:
-                matches = False
-                break
-
-            if isinstance(value, str):
-                # String matching (case-insensitive)
-                if value.lower() not in str(obj[key]).lower():
-                    matches = False
-                    break
-            elif isinstance(value, list):
-                # List contains matching
-                if obj[key] not in value:
-                    matches = False
-                    break
-            else:
-                # Exact matching
-                if obj[key] != value:
-                    matches = False
-                    break
-
-        if matches:
-            filtered.append(obj)
-
-    return filtered
+                return False
+            if kind == "substr":
+                if value not in str(obj[key]).lower():
+                    return False
+            elif kind == "in":
+                try:
+                    if obj[key] not in value:
+                        return False
+                except TypeError:
+                    # Unhashable object value; fall back to the linear
+                    # equality scan a plain list membership would do
+                    if not any(obj[key] == item for item in value):
+                        return False
+            elif obj[key] != value:
+                return False
+        return True
+
+    return [obj for obj in clip_objects if matches(obj)]
 
 
 def merge_clip_objects(
@@ -216,18 +234,24 @@ def merge_clip_objects(
     Returns:
         Merged CLIP object
     """
+    # copy()+update() fills the merged dict in place rather than
+    # unpacking both inputs into a fresh literal
     if prefer_update:
-        merged = {**base, **update}
+        merged = base.copy()
+        merged.update(update)
     else:
-        merged = {**update, **base}
+        merged = update.copy()
+        merged.update(base)
 
     # Handle array fields specially (merge rather than replace)
-    array_fields = ["features", "actions", "services"]
-
-    for field in array_fields:
+    for field in _ARRAY_FIELDS:
         if field in base and field in update:
-            base_items = base[field] if isinstance(base[field], list) else []
-            update_items = update[field] if isinstance(update[field], list) else []
+            base_items = base[field]
+            if not isinstance(base_items, list):
+                base_items = []
+            update_items = update[field]
+            if not isinstance(update_items, list):
+                update_items = []
             merged[field] = base_items + update_items
 
     return merged
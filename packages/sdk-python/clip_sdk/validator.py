@@ -4,16 +4,29 @@ CLIP object validation using JSON Schema.
 
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import requests
-from jsonschema import Draft202012Validator, ValidationError
+from jsonschema import Draft202012Validator
 from jsonschema.validators import RefResolver
 
 from .utils import load_json_from_path
 
+try:
+    import jsonschema_rs as _jsonschema_rs
+except ImportError:  # pragma: no cover - exercised when jsonschema-rs is absent
+    _jsonschema_rs = None
+
 logger = logging.getLogger(__name__)
 
+# Compiled validators shared across CLIPValidator instances, keyed by
+# schema source. Compiling a validator walks the whole schema, so
+# short-lived validators would otherwise redo that work (and the
+# network fetch) on every instantiation.
+_compiled_validators: "OrderedDict[Tuple[str, Optional[str]], Any]" = OrderedDict()
+_compiled_validators_max = 8
+
 
 class CLIPValidationError(Exception):
     """Custom exception for CLIP validation errors."""
@@ -59,7 +72,7 @@ class CLIPValidator:
         self.cache_schema = cache_schema
         self.strict_mode = strict_mode
         self._schema: Optional[Dict[str, Any]] = None
-        self._validator: Optional[Draft202012Validator] = None
+        self._validator: Optional[Any] = None
 
     def load_schema(self) -> Dict[str, Any]:
         """
@@ -96,21 +109,44 @@ class CLIPValidator:
         ) as e:
             raise CLIPValidationError(f"Failed to load CLIP schema: {str(e)}")
 
-    def get_validator(self) -> Draft202012Validator:
+    def get_validator(self) -> Any:
         """
         Get a configured JSON schema validator.
 
+        Uses the Rust-backed jsonschema-rs validator when it is
+        installed (install the ``perf`` extra), falling back to the
+        pure-Python Draft 2020-12 validator. Both expose the
+        ``validate``/``iter_errors`` interface that :meth:`validate`
+        relies on.
+
         Returns:
             Configured validator instance
         """
         if self._validator is not None:
             return self._validator
 
+        cache_key = (self.schema_url, self.schema_path)
+        if self.cache_schema:
+            cached = _compiled_validators.get(cache_key)
+            if cached is not None:
+                _compiled_validators.move_to_end(cache_key)
+                self._validator = cached
+                return cached
+
         schema = self.load_schema()
 
-        # Create validator with proper resolver for $ref resolution
-        resolver = RefResolver.from_schema(schema)
-        self._validator = Draft202012Validator(schema, resolver=resolver)
+        if _jsonschema_rs is not None:
+            # The Rust validator resolves internal $refs itself
+            self._validator = _jsonschema_rs.validator_for(schema)
+        else:
+            # Create validator with proper resolver for $ref resolution
+            resolver = RefResolver.from_schema(schema)
+            self._validator = Draft202012Validator(schema, resolver=resolver)
+
+        if self.cache_schema:
+            _compiled_validators[cache_key] = self._validator
+            if len(_compiled_validators) > _compiled_validators_max:
+                _compiled_validators.popitem(last=False)
 
         return self._validator
 
@@ -137,18 +173,16 @@ class CLIPValidator:
                 }
 
         validator = self.get_validator()
-        errors = []
         warnings = []
 
-        # Perform validation
-        try:
-            validator.validate(clip_object)
-            is_valid = True
-        except ValidationError:
-            is_valid = False
-            # Collect all validation errors
-            for error in validator.iter_errors(clip_object):
-                errors.append(self._format_validation_error(error))
+        # Single traversal: iter_errors yields nothing for a valid
+        # object, so there is no need for a separate validate() pass
+        # that re-walks the schema just to raise
+        errors = [
+            self._format_validation_error(error)
+            for error in validator.iter_errors(clip_object)
+        ]
+        is_valid = not errors
 
         # Generate warnings for common issues
         warnings.extend(self._generate_warnings(clip_object))
@@ -207,13 +241,14 @@ class CLIPValidator:
                 "stats": {},
             }
 
-    def _format_validation_error(self, error: ValidationError) -> Dict[str, Any]:
+    def _format_validation_error(self, error: Any) -> Dict[str, Any]:
         """Format a JSON schema validation error into a user-friendly format."""
-        field_path = (
-            ".".join(str(p) for p in error.absolute_path)
-            if error.absolute_path
-            else "root"
-        )
+        # jsonschema exposes the path as absolute_path, jsonschema-rs as
+        # instance_path; both are sequences of keys and indices
+        path = getattr(error, "absolute_path", None)
+        if path is None:
+            path = getattr(error, "instance_path", ())
+        field_path = ".".join(str(p) for p in path) if path else "root"
 
         # Generate helpful suggestions based on error type
         suggestion = self._get_error_suggestion(error)
@@ -225,7 +260,7 @@ class CLIPValidator:
             "suggestion": suggestion,
         }
 
-    def _get_error_suggestion(self, error: ValidationError) -> Optional[str]:
+    def _get_error_suggestion(self, error: Any) -> Optional[str]:
         """Generate helpful suggestions based on validation error."""
         if "required" in error.message:
             return (
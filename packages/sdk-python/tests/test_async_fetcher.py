@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, patch
 
 import aiohttp
 import pytest
+import pytest_asyncio
 from aioresponses import aioresponses
 
 from clip_sdk import AsyncCLIPFetcher, AsyncCLIPFetchError, CLIPFetcher
@@ -30,15 +31,21 @@ INVALID_CLIP_OBJECT = {"type": "Unknown", "name": "Invalid Object"}
 class TestAsyncCLIPFetcher:
     """Test the AsyncCLIPFetcher class."""
 
-    @pytest.fixture
-    def fetcher(self):
+    @pytest_asyncio.fixture
+    async def fetcher(self):
         """Create a test async fetcher."""
-        return AsyncCLIPFetcher(timeout=5.0, max_retries=2, cache_enabled=False)
+        async with AsyncCLIPFetcher(
+            timeout=5.0, max_retries=2, cache_enabled=False
+        ) as fetcher:
+            yield fetcher
 
-    @pytest.fixture
-    def cached_fetcher(self):
+    @pytest_asyncio.fixture
+    async def cached_fetcher(self):
         """Create a test async fetcher with caching enabled."""
-        return AsyncCLIPFetcher(timeout=5.0, max_retries=2, cache_enabled=True)
+        async with AsyncCLIPFetcher(
+            timeout=5.0, max_retries=2, cache_enabled=True
+        ) as fetcher:
+            yield fetcher
 
     @pytest.fixture
     def temp_clip_file(self):
@@ -96,6 +103,40 @@ class TestAsyncCLIPFetcher:
             request_calls = m.requests[request_key]
             assert len(request_calls) == 2
 
+    @pytest.mark.asyncio
+    async def test_fetch_from_url_non_retryable_status(self, fetcher):
+        """Test that a non-retryable HTTP status fails without retrying."""
+        url = "https://api.example.com/clip/forbidden"
+
+        with aioresponses() as m:
+            m.get(url, status=403)
+
+            with pytest.raises(AsyncCLIPFetchError):
+                await fetcher.fetch_from_url(url)
+
+            # 403 is not in _RETRYABLE_STATUSES, so exactly one request
+            # goes out despite max_retries=2
+            from yarl import URL
+
+            request_calls = m.requests[("GET", URL(url))]
+            assert len(request_calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_honors_retry_after(self, fetcher):
+        """Test backoff delay calculation against Retry-After headers."""
+        exc = aiohttp.ClientResponseError(
+            request_info=None, history=(), status=429, headers={"Retry-After": "3"}
+        )
+        assert fetcher._retry_delay(0, exc) == 3.0
+
+        # Oversized values are clamped to the backoff cap
+        exc.headers = {"Retry-After": "9999"}
+        assert fetcher._retry_delay(0, exc) == 30.0
+
+        # Non-numeric (HTTP-date) values fall back to jittered backoff
+        exc.headers = {"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"}
+        assert 0 <= fetcher._retry_delay(0, exc) <= 0.5
+
     @pytest.mark.asyncio
     async def test_fetch_from_url_timeout(self, fetcher):
         """Test async URL fetching with timeout."""
@@ -251,6 +292,45 @@ class TestAsyncCLIPFetcher:
             assert len(failed_sources) == 1
             assert failed_sources[0]["source"] == urls[1]
 
+    @pytest.mark.asyncio
+    async def test_fetch_batch_refetches_poisoned_cache_entry(self, cached_fetcher):
+        """Test that a structurally invalid cached entry is refetched."""
+        url = "https://api.example.com/clip/poisoned"
+        cached_fetcher.cache.set(url, INVALID_CLIP_OBJECT)
+
+        with aioresponses() as m:
+            m.get(
+                url,
+                payload=VALID_CLIP_OBJECT,
+                headers={"Content-Type": "application/json"},
+            )
+
+            results = await cached_fetcher.fetch_batch([url])
+
+        assert results == [VALID_CLIP_OBJECT]
+        # The fresh body replaced the poisoned entry
+        assert cached_fetcher.cache.get(url) == VALID_CLIP_OBJECT
+        cached_fetcher.clear_cache()
+
+    @pytest.mark.asyncio
+    async def test_fetch_batch_does_not_cache_invalid_body(self, cached_fetcher):
+        """Test that an invalid fresh body is rejected before caching."""
+        url = "https://api.example.com/clip/invalid-body"
+
+        with aioresponses() as m:
+            m.get(
+                url,
+                payload=INVALID_CLIP_OBJECT,
+                headers={"Content-Type": "application/json"},
+            )
+
+            results = await cached_fetcher.fetch_batch([url])
+
+        assert len(results) == 1
+        assert isinstance(results[0], Exception)
+        assert cached_fetcher.cache.get(url) is None
+        cached_fetcher.clear_cache()
+
     @pytest.mark.asyncio
     async def test_fetch_multiple_success(self, fetcher):
         """Test successful async multiple fetching (only successful results)."""
@@ -278,6 +358,43 @@ class TestAsyncCLIPFetcher:
             assert len(results) == 2  # Only successful results
             assert all(isinstance(result, dict) for result in results)
 
+    @pytest.mark.asyncio
+    async def test_iter_multiple_yields_successes_records_failures(self, fetcher):
+        """Test that iter_multiple yields successes and tracks failures."""
+        urls = [
+            "https://api.example.com/clip/1",
+            "https://api.example.com/clip/error",
+            "https://api.example.com/clip/3",
+        ]
+
+        with aioresponses() as m:
+            m.get(
+                urls[0],
+                payload={**VALID_CLIP_OBJECT, "id": "clip:test:venue:library1"},
+                headers={"Content-Type": "application/json"},
+            )
+            m.get(urls[1], status=500)
+            m.get(
+                urls[2],
+                payload={**VALID_CLIP_OBJECT, "id": "clip:test:venue:library3"},
+                headers={"Content-Type": "application/json"},
+            )
+
+            collected = []
+            async for clip_object in fetcher.iter_multiple(urls):
+                collected.append(clip_object)
+
+        # Only successes are yielded, in completion order (not source
+        # order), so compare as a set
+        assert {clip["id"] for clip in collected} == {
+            "clip:test:venue:library1",
+            "clip:test:venue:library3",
+        }
+
+        failed_sources = fetcher.get_failed_sources()
+        assert len(failed_sources) == 1
+        assert failed_sources[0]["source"] == urls[1]
+
     @pytest.mark.asyncio
     async def test_concurrency_limiting(self, fetcher):
         """Test that concurrent requests are properly limited."""
@@ -300,6 +417,69 @@ class TestAsyncCLIPFetcher:
             # With 5 concurrent requests, it should take some time
             assert end_time - start_time > 0
 
+    def test_adaptive_concurrency_halves_on_connection_errors(self):
+        """Test the AIMD controller backs off after connection errors."""
+        fetcher = AsyncCLIPFetcher(
+            cache_enabled=False, max_concurrent=16, adaptive_concurrency=True
+        )
+
+        fetcher._window_conn_errors = 1
+        fetcher._adjust_concurrency()
+        assert fetcher.max_concurrent == 8
+
+        # Repeated bad windows never drop the limit below the floor
+        for _ in range(5):
+            fetcher._window_conn_errors = 1
+            fetcher._adjust_concurrency()
+        assert fetcher.max_concurrent == 4
+
+    def test_adaptive_concurrency_grows_when_saturated(self):
+        """Test the AIMD controller grows only clean, saturated windows."""
+        fetcher = AsyncCLIPFetcher(
+            cache_enabled=False, max_concurrent=8, adaptive_concurrency=True
+        )
+
+        # A clean window with more successes than the limit grows it
+        fetcher._window_successes = 20
+        fetcher._adjust_concurrency()
+        assert fetcher.max_concurrent == 12
+
+        # An idle window (limit not saturated) leaves it alone
+        fetcher._window_successes = 4
+        fetcher._adjust_concurrency()
+        assert fetcher.max_concurrent == 12
+
+        # Growth is capped at four times the configured limit
+        for _ in range(20):
+            fetcher._window_successes = 1000
+            fetcher._adjust_concurrency()
+        assert fetcher.max_concurrent == fetcher._adaptive_cap == 32
+
+        # Each adjustment consumes the window counters
+        stats = fetcher.get_adaptive_stats()
+        assert stats["window_successes"] == 0
+        assert stats["window_connection_errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_inflight_request_coalescing(self, fetcher):
+        """Test that concurrent fetches of one URL share a single request."""
+        url = "https://api.example.com/clip/coalesced"
+
+        with aioresponses() as m:
+            # Register a single response; duplicate requests would fail
+            m.get(
+                url,
+                payload=VALID_CLIP_OBJECT,
+                headers={"Content-Type": "application/json"},
+            )
+
+            results = await asyncio.gather(
+                *(fetcher.fetch_from_url(url, use_cache=False) for _ in range(5))
+            )
+
+            assert len(results) == 5
+            assert all(result == VALID_CLIP_OBJECT for result in results)
+
     @pytest.mark.asyncio
     async def test_cache_integration(self, cached_fetcher):
         """Test async fetcher integration with caching."""
@@ -436,50 +616,50 @@ class TestPerformanceComparison:
         urls = [f"https://api.example.com/clip/{i}" for i in range(10)]
 
         # Test async fetcher (sync fetcher is tested in a separate test file)
-        async_fetcher = AsyncCLIPFetcher(cache_enabled=False)
-
-        with aioresponses() as m:
-            for url in urls:
-                m.get(
-                    url,
-                    payload=VALID_CLIP_OBJECT,
-                    headers={"Content-Type": "application/json"},
+        async with AsyncCLIPFetcher(cache_enabled=False) as async_fetcher:
+            with aioresponses() as m:
+                for url in urls:
+                    m.get(
+                        url,
+                        payload=VALID_CLIP_OBJECT,
+                        headers={"Content-Type": "application/json"},
+                    )
+
+                # Time async batch fetch
+                start_time = time.time()
+                async_results = await async_fetcher.fetch_batch(urls, max_concurrent=5)
+                async_time = time.time() - start_time
+
+                assert len(async_results) == 10
+                assert all(
+                    not isinstance(result, Exception) for result in async_results
                 )
 
-            # Time async batch fetch
-            start_time = time.time()
-            async_results = await async_fetcher.fetch_batch(urls, max_concurrent=5)
-            async_time = time.time() - start_time
-
-            assert len(async_results) == 10
-            assert all(not isinstance(result, Exception) for result in async_results)
-
-            # Async should be reasonably fast due to concurrency
-            assert async_time < 2.0  # Should complete in under 2 seconds
+                # Async should be reasonably fast due to concurrency
+                assert async_time < 2.0  # Should complete in under 2 seconds
 
     @pytest.mark.asyncio
     async def test_concurrent_request_efficiency(self):
         """Test that concurrent requests are more efficient than sequential."""
         urls = [f"https://api.example.com/clip/concurrent/{i}" for i in range(5)]
 
-        async_fetcher = AsyncCLIPFetcher(cache_enabled=False)
-
-        with aioresponses() as m:
-            for url in urls:
-                # Add a small delay to simulate network latency
-                m.get(
-                    url,
-                    payload=VALID_CLIP_OBJECT,
-                    headers={"Content-Type": "application/json"},
-                )
-
-            # Test concurrent fetching
-            start_time = time.time()
-            results = await async_fetcher.fetch_batch(urls, max_concurrent=5)
-            concurrent_time = time.time() - start_time
-
-            assert len(results) == 5
-            assert all(not isinstance(result, Exception) for result in results)
-
-            # With proper async handling, this should be efficient
-            assert concurrent_time < 1.0
+        async with AsyncCLIPFetcher(cache_enabled=False) as async_fetcher:
+            with aioresponses() as m:
+                for url in urls:
+                    # Add a small delay to simulate network latency
+                    m.get(
+                        url,
+                        payload=VALID_CLIP_OBJECT,
+                        headers={"Content-Type": "application/json"},
+                    )
+
+                # Test concurrent fetching
+                start_time = time.time()
+                results = await async_fetcher.fetch_batch(urls, max_concurrent=5)
+                concurrent_time = time.time() - start_time
+
+                assert len(results) == 5
+                assert all(not isinstance(result, Exception) for result in results)
+
+                # With proper async handling, this should be efficient
+                assert concurrent_time < 1.0
@@ -170,6 +170,72 @@ class TestCLIPCache:
         assert cache.get("key2") is None  # Should be evicted
         assert cache.get("key3") is not None  # Should be there
 
+    def test_get_many(self):
+        """Test batched memory lookups."""
+        cache = CLIPCache(cache_dir=None, max_age=None)
+
+        cache.set("key1", {"data": 1})
+        cache.set("key2", {"data": 2})
+
+        results = cache.get_many(["key1", "key2", "missing"])
+
+        # Hits come back keyed by cache key; misses simply don't appear
+        assert results == {"key1": {"data": 1}, "key2": {"data": 2}}
+
+    def test_get_many_drops_expired_entries(self):
+        """Test that get_many removes expired entries during the scan."""
+        cache = CLIPCache(cache_dir=None, max_age=None)
+
+        cache.set("fresh", {"data": 1})
+        cache.set("stale", {"data": 2}, max_age=0.05)  # Very short expiration
+
+        time.sleep(0.1)
+        results = cache.get_many(["fresh", "stale"])
+
+        assert results == {"fresh": {"data": 1}}
+        # The expired entry was evicted from memory, not just skipped
+        assert "stale" not in cache.memory_cache
+
+    def test_fifo_eviction(self):
+        """Test FIFO eviction ignores recency and evicts the oldest insertion."""
+        cache = CLIPCache(cache_dir=None, max_memory_entries=2, eviction="fifo")
+
+        cache.set("key1", {"data": 1})
+        time.sleep(0.01)  # Ensure different timestamps
+        cache.set("key2", {"data": 2})
+
+        time.sleep(0.01)
+        # Recent access must not save key1: FIFO only looks at creation order
+        cache.get("key1")
+
+        cache.set("key3", {"data": 3})
+
+        assert cache.get("key1") is None  # Oldest insertion, evicted
+        assert cache.get("key2") is not None
+        assert cache.get("key3") is not None
+
+    def test_two_random_eviction(self):
+        """Test 2-random eviction picks the staler of the sampled pair."""
+        cache = CLIPCache(cache_dir=None, max_memory_entries=2, eviction="2-random")
+
+        # With exactly two entries the sample always covers both, so the
+        # victim choice is deterministic: the older accessed_at loses
+        cache.set("key1", {"data": 1})
+        time.sleep(0.01)  # Ensure different timestamps
+        cache.set("key2", {"data": 2})
+
+        time.sleep(0.01)
+        cache.set("key3", {"data": 3})
+
+        assert cache.get("key1") is None  # Staler of the sampled pair
+        assert cache.get("key2") is not None
+        assert cache.get("key3") is not None
+
+    def test_invalid_eviction_policy(self):
+        """Test that an unknown eviction policy is rejected."""
+        with pytest.raises(ValueError, match="Eviction policy"):
+            CLIPCache(cache_dir=None, eviction="mru")
+
     def test_cache_clear(self):
         """Test cache clearing."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -195,6 +261,40 @@ class TestCLIPCache:
             assert cache.get("key1") is None
             assert cache.get("key2") is None
 
+    def test_write_behind_flush_visibility(self):
+        """Test write-behind entries reach disk only on flush."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CLIPCache(cache_dir=temp_dir, write_behind=True)
+            cache.set("key1", {"data": 1})
+
+            # The owning instance serves the pending write immediately
+            assert cache.get("key1") == {"data": 1}
+
+            # But nothing has reached the filesystem yet, so another
+            # instance sharing the directory can't see it
+            assert list(Path(temp_dir).glob("*.json")) == []
+            other = CLIPCache(cache_dir=temp_dir)
+            assert other.get("key1") is None
+
+            cache.flush()
+
+            assert len(list(Path(temp_dir).glob("*.json"))) == 1
+            other = CLIPCache(cache_dir=temp_dir)
+            assert other.get("key1") == {"data": 1}
+
+    def test_write_behind_clear_discards_dirty(self):
+        """Test that clear() drops pending writes instead of flushing them."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CLIPCache(cache_dir=temp_dir, write_behind=True)
+            cache.set("key1", {"data": 1})
+
+            cache.clear()
+            # A later flush must not resurrect the cleared entry
+            cache.flush()
+
+            assert cache.get("key1") is None
+            assert list(Path(temp_dir).glob("*.json")) == []
+
     def test_cache_stats(self):
         """Test cache statistics."""
         cache = CLIPCache(cache_dir=None)
@@ -232,6 +332,76 @@ class TestCLIPCache:
             cache_files = list(Path(temp_dir).glob("*.json"))
             assert len(cache_files) < 10
 
+    def test_msgpack_round_trip(self):
+        """Test msgpack-serialized entries survive a disk round trip."""
+        pytest.importorskip("msgpack")
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = CLIPCache(cache_dir=temp_dir, serializer="msgpack")
+            data = {"test": "data", "nested": {"flag": True, "count": 3}}
+            cache.set("key1", data)
+
+            assert cache._file_suffix == ".msgpack"
+            assert len(list(Path(temp_dir).glob("*.msgpack"))) == 1
+
+            # Re-read from disk, both in this instance and a fresh one
+            cache.memory_cache.clear()
+            assert cache.get("key1") == data
+
+            other = CLIPCache(cache_dir=temp_dir, serializer="msgpack")
+            assert other.get("key1") == data
+
+    def test_msgpack_fallback_without_dependency(self):
+        """Test graceful fallback to json when msgpack is unavailable."""
+        with patch("clip_sdk.cache._msgpack", None):
+            cache = CLIPCache(cache_dir=None, serializer="msgpack")
+
+        assert cache.serializer == "json"
+        assert cache._file_suffix == ".json"
+
+    def test_tinylfu_rejects_cold_newcomer(self):
+        """Test TinyLFU keeps hot residents over a one-hit newcomer."""
+        cache = CLIPCache(cache_dir=None, max_memory_entries=2, admission="tinylfu")
+
+        cache.set("hot1", {"data": 1})
+        cache.set("hot2", {"data": 2})
+        for _ in range(5):
+            cache.get("hot1")
+            cache.get("hot2")
+
+        # A key seen once is colder than the eviction victim, so it is
+        # refused admission instead of displacing a hot entry
+        cache.set("cold", {"data": 3})
+
+        assert "cold" not in cache.memory_cache
+        assert cache.get("hot1") is not None
+        assert cache.get("hot2") is not None
+
+    def test_tinylfu_admits_frequent_newcomer(self):
+        """Test TinyLFU admits a newcomer hotter than the victim."""
+        cache = CLIPCache(cache_dir=None, max_memory_entries=2, admission="tinylfu")
+
+        cache.set("old1", {"data": 1})
+        cache.set("old2", {"data": 2})
+
+        # Repeated lookups bump the frequency sketch even on misses, so by
+        # the time the newcomer is stored it outranks the victim
+        for _ in range(5):
+            cache.get("newcomer")
+        cache.set("newcomer", {"data": 3})
+
+        assert "newcomer" in cache.memory_cache
+        assert len(cache.memory_cache) == 2
+
+    def test_invalid_admission_policy(self):
+        """Test that an unknown admission policy is rejected."""
+        with pytest.raises(ValueError, match="Admission policy"):
+            CLIPCache(cache_dir=None, admission="lfu")
+
+    def test_invalid_serializer(self):
+        """Test that an unknown serializer is rejected."""
+        with pytest.raises(ValueError, match="Serializer"):
+            CLIPCache(cache_dir=None, serializer="pickle")
+
     def test_periodic_cleanup(self):
         """Test periodic cleanup of expired entries."""
         cache = CLIPCache(cache_dir=None, cleanup_interval_seconds=0.1)
@@ -174,6 +174,65 @@ class TestCLIPObject:
         assert data["type"] == "Device"
         assert data["name"] == "Test Device"
 
+    def test_serialization_reflects_field_assignment(self):
+        """Test that plain field assignment shows up in later dumps."""
+        clip_obj = CLIPObject(
+            **{
+                "@context": "https://clipprotocol.org/v1",
+                "type": "Venue",
+                "id": "clip:test:venue:123",
+                "name": "Old Name",
+                "description": "A test venue",
+            }
+        )
+        assert json.loads(clip_obj.to_json())["name"] == "Old Name"
+
+        clip_obj.name = "New Name"
+        assert json.loads(clip_obj.to_json())["name"] == "New Name"
+        assert clip_obj.to_dict()["name"] == "New Name"
+        assert "New Name" in str(clip_obj)
+        assert "New Name" in repr(clip_obj)
+
+    def test_serialization_reflects_nested_mutation(self):
+        """Test that edits inside nested models show up in later dumps."""
+        clip_obj = CLIPObject(
+            **{
+                "@context": "https://clipprotocol.org/v1",
+                "type": "Venue",
+                "id": "clip:test:venue:123",
+                "name": "Test Venue",
+                "description": "A test venue",
+            }
+        )
+        clip_obj.add_feature(name="WiFi", type="amenity")
+        assert json.loads(clip_obj.to_json())["features"][0]["name"] == "WiFi"
+
+        clip_obj.features[0].name = "Renamed"
+        assert json.loads(clip_obj.to_json())["features"][0]["name"] == "Renamed"
+
+        clip_obj.set_location(address="123 Main St")
+        clip_obj.to_json()
+        clip_obj.location.address = "456 Oak Ave"
+        data = clip_obj.to_dict()
+        assert data["location"]["address"] == "456 Oak Ave"
+
+    def test_to_dict_returns_fresh_containers(self):
+        """Test that mutating to_dict output doesn't affect later calls."""
+        clip_obj = CLIPObject(
+            **{
+                "@context": "https://clipprotocol.org/v1",
+                "type": "Venue",
+                "id": "clip:test:venue:123",
+                "name": "Test Venue",
+                "description": "A test venue",
+            }
+        )
+        clip_obj.set_location(address="123 Main St")
+
+        data = clip_obj.to_dict()
+        data["location"]["address"] = "mutated"
+        assert clip_obj.to_dict()["location"]["address"] == "123 Main St"
+
     def test_update_timestamp(self):
         """Test updating the timestamp."""
         clip_obj = CLIPObject(
@@ -34,21 +34,26 @@ class TestCLIPFetcher:
 
         assert fetcher._is_url("https://example.com/clip.json") is True
         assert fetcher._is_url("http://example.com/clip.json") is True
+        # Schemes are case-insensitive per RFC 3986
+        assert fetcher._is_url("HTTP://EXAMPLE.COM/clip.json") is True
+        assert fetcher._is_url("HTTPS://example.com/clip.json") is True
         assert fetcher._is_url("/path/to/file.json") is False
         assert fetcher._is_url("file.json") is False
         assert fetcher._is_url("") is False
 
-    @patch("clip_sdk.fetcher.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_url_success(self, mock_get):
         """Test successful URL fetching."""
         mock_response = Mock()
-        mock_response.json.return_value = {
-            "@context": "https://clipprotocol.org/v1",
-            "type": "Venue",
-            "id": "clip:test:venue:123",
-            "name": "Test Venue",
-            "description": "A test venue",
-        }
+        mock_response.content = json.dumps(
+            {
+                "@context": "https://clipprotocol.org/v1",
+                "type": "Venue",
+                "id": "clip:test:venue:123",
+                "name": "Test Venue",
+                "description": "A test venue",
+            }
+        ).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
 
@@ -60,22 +65,23 @@ class TestCLIPFetcher:
         mock_get.assert_called_once_with(
             "https://example.com/clip.json",
             timeout=30.0,
-            headers={
-                "Accept": "application/json",
-                "User-Agent": "CLIP-SDK-Python/0.1.0",
-            },
         )
+        # Static headers live on the pooled session
+        assert fetcher._session.headers["Accept"] == "application/json"
+        assert fetcher._session.headers["User-Agent"] == "CLIP-SDK-Python/0.1.0"
 
-    @patch("clip_sdk.fetcher.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_url_retry(self, mock_get):
         """Test URL fetching with retries."""
         # First two calls fail, third succeeds
         mock_response_success = Mock()
-        mock_response_success.json.return_value = {
-            "@context": "https://clipprotocol.org/v1",
-            "type": "Venue",
-            "id": "clip:test:venue:123",
-        }
+        mock_response_success.content = json.dumps(
+            {
+                "@context": "https://clipprotocol.org/v1",
+                "type": "Venue",
+                "id": "clip:test:venue:123",
+            }
+        ).encode()
         mock_response_success.raise_for_status.return_value = None
 
         mock_get.side_effect = [
@@ -90,7 +96,7 @@ class TestCLIPFetcher:
         assert result["type"] == "Venue"
         assert mock_get.call_count == 3
 
-    @patch("clip_sdk.fetcher.requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_url_all_retries_fail(self, mock_get):
         """Test URL fetching when all retries fail."""
         mock_get.side_effect = requests.RequestException("Network error")
@@ -185,6 +191,59 @@ class TestCLIPFetcher:
         assert len(failed_sources) == 1
         assert "/non/existent/file.json" in failed_sources[0]["source"]
 
+    @patch("requests.Session.get")
+    def test_fetch_url_batch(self, mock_get):
+        """Test batched URL fetching preserves input order."""
+
+        def respond(url, **kwargs):
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.content = json.dumps(
+                {
+                    "@context": "https://clipprotocol.org/v1",
+                    "type": "Venue",
+                    "id": url,
+                }
+            ).encode()
+            mock_response.headers = {}
+            mock_response.raise_for_status.return_value = None
+            return mock_response
+
+        mock_get.side_effect = respond
+
+        fetcher = CLIPFetcher()
+        urls = [f"https://example.com/clip{i}.json" for i in range(3)]
+
+        results = fetcher.fetch_url_batch(urls)
+
+        assert [result["id"] for result in results] == urls
+        assert fetcher.get_failed_sources() == []
+
+    def test_fetch_file_batch(self, tmp_path):
+        """Test batched file fetching with order and failure handling."""
+        file_paths = []
+        for i in range(3):
+            clip_data = {
+                "@context": "https://clipprotocol.org/v1",
+                "type": "Venue",
+                "id": f"clip:test:venue:{i}",
+            }
+            clip_file = tmp_path / f"clip{i}.json"
+            clip_file.write_text(json.dumps(clip_data))
+            file_paths.append(str(clip_file))
+
+        fetcher = CLIPFetcher()
+        results = fetcher.fetch_file_batch(file_paths + ["/non/existent/file.json"])
+
+        # Successes keep input order; the failed slot is dropped
+        assert [result["id"] for result in results] == [
+            f"clip:test:venue:{i}" for i in range(3)
+        ]
+
+        failed_sources = fetcher.get_failed_sources()
+        assert len(failed_sources) == 1
+        assert failed_sources[0]["source"] == "/non/existent/file.json"
+
     def test_validate_basic_structure_valid(self):
         """Test basic structure validation with valid CLIP object."""
         fetcher = CLIPFetcher()
@@ -45,12 +45,12 @@ class TestCLIPFetcherCaching:
         assert fetcher.cache_enabled is False
         assert fetcher.cache is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_from_url_with_caching(self, mock_get):
         """Test URL fetching with caching."""
         # Mock successful response
         mock_response = Mock()
-        mock_response.json.return_value = self.sample_clip
+        mock_response.content = json.dumps(self.sample_clip).encode()
         mock_response.headers = {"Cache-Control": "max-age=3600"}
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -71,11 +71,11 @@ class TestCLIPFetcherCaching:
             assert result2 == self.sample_clip
             assert mock_get.call_count == 1  # Should not increase
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_cache_miss_then_hit(self, mock_get):
         """Test cache miss followed by cache hit."""
         mock_response = Mock()
-        mock_response.json.return_value = self.sample_clip
+        mock_response.content = json.dumps(self.sample_clip).encode()
         mock_response.headers = {}
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -107,11 +107,11 @@ class TestCLIPFetcherCaching:
         assert stats["hits"] == 1
         assert stats["misses"] == 1
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_with_cache_disabled_parameter(self, mock_get):
         """Test fetch with cache disabled via parameter."""
         mock_response = Mock()
-        mock_response.json.return_value = self.sample_clip
+        mock_response.content = json.dumps(self.sample_clip).encode()
         mock_response.headers = {}
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -137,14 +137,14 @@ class TestCLIPFetcherCaching:
         assert stats["hits"] == 0
         assert stats["misses"] == 0
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_with_validation_disabled(self, mock_get):
         """Test fetch with validation disabled."""
         # Invalid CLIP object (missing required fields)
         invalid_clip = {"name": "Invalid CLIP"}
 
         mock_response = Mock()
-        mock_response.json.return_value = invalid_clip
+        mock_response.content = json.dumps(invalid_clip).encode()
         mock_response.headers = {}
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -162,11 +162,11 @@ class TestCLIPFetcherCaching:
         result = fetcher.fetch_from_url(url, validate=False)
         assert result == invalid_clip
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_cache_http_headers_max_age(self, mock_get):
         """Test caching with HTTP max-age header."""
         mock_response = Mock()
-        mock_response.json.return_value = self.sample_clip
+        mock_response.content = json.dumps(self.sample_clip).encode()
         mock_response.headers = {"Cache-Control": "max-age=1"}  # 1 second
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -193,11 +193,49 @@ class TestCLIPFetcherCaching:
         assert result3 == self.sample_clip
         assert mock_get.call_count == 2
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
+    def test_conditional_get_reuses_retained_body(self, mock_get):
+        """Test that a 304 revalidation reuses the retained body."""
+        first_response = Mock()
+        first_response.status_code = 200
+        first_response.content = json.dumps(self.sample_clip).encode()
+        first_response.headers = {
+            "ETag": '"abc123"',
+            "Cache-Control": "no-cache",
+        }
+        first_response.raise_for_status.return_value = None
+
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.content = b""
+        not_modified.headers = {"Cache-Control": "no-cache"}
+
+        mock_get.side_effect = [first_response, not_modified]
+
+        cache = CLIPCache(cache_dir=None)
+        fetcher = CLIPFetcher(cache=cache, cache_enabled=True)
+
+        url = "https://example.com/clip.json"
+
+        # First fetch retains the ETag; no-cache keeps the body out of
+        # the cache so the second fetch must go back to the origin
+        result1 = fetcher.fetch_from_url(url)
+        assert result1 == self.sample_clip
+
+        # Second fetch revalidates instead of re-downloading: the
+        # request carries the validator and the 304 body is reused
+        result2 = fetcher.fetch_from_url(url)
+        assert result2 == self.sample_clip
+
+        assert mock_get.call_count == 2
+        sent_headers = mock_get.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"abc123"'
+
+    @patch("requests.Session.get")
     def test_cache_no_cache_header(self, mock_get):
         """Test caching with no-cache header."""
         mock_response = Mock()
-        mock_response.json.return_value = self.sample_clip
+        mock_response.content = json.dumps(self.sample_clip).encode()
         mock_response.headers = {"Cache-Control": "no-cache"}
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -261,11 +299,11 @@ class TestCLIPFetcherCaching:
         fetcher.set_cache_max_age(None)
         assert cache.max_age is None
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_prefetch_urls(self, mock_get):
         """Test URL prefetching functionality."""
         mock_response = Mock()
-        mock_response.json.return_value = self.sample_clip
+        mock_response.content = json.dumps(self.sample_clip).encode()
         mock_response.headers = {}
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -297,7 +335,7 @@ class TestCLIPFetcherCaching:
         assert len(results2["cached"]) == 3
         assert len(results2["successful"]) == 0
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_prefetch_with_failures(self, mock_get):
         """Test prefetching with some failures."""
 
@@ -306,7 +344,7 @@ class TestCLIPFetcherCaching:
                 raise requests.RequestException("Network error")
 
             mock_response = Mock()
-            mock_response.json.return_value = self.sample_clip
+            mock_response.content = json.dumps(self.sample_clip).encode()
             mock_response.headers = {}
             mock_response.raise_for_status.return_value = None
             return mock_response
@@ -357,11 +395,11 @@ class TestCLIPFetcherCaching:
 
             os.unlink(temp_file)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fetch_multiple_with_caching(self, mock_get):
         """Test fetch_multiple with caching."""
         mock_response = Mock()
-        mock_response.json.return_value = self.sample_clip
+        mock_response.content = json.dumps(self.sample_clip).encode()
         mock_response.headers = {}
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
@@ -390,7 +428,7 @@ class TestCLIPFetcherCaching:
 class TestCachePerformance:
     """Test caching performance benefits."""
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_cache_performance_improvement(self, mock_get):
         """Test that caching improves performance."""
 
@@ -398,12 +436,14 @@ class TestCachePerformance:
         def slow_response(*args, **kwargs):
             time.sleep(0.1)  # Simulate network delay
             mock_response = Mock()
-            mock_response.json.return_value = {
-                "@context": "https://clipprotocol.org/context/v1",
-                "type": "Venue",
-                "id": "clip:test:venue:perf",
-                "name": "Performance Test Venue",
-            }
+            mock_response.content = json.dumps(
+                {
+                    "@context": "https://clipprotocol.org/context/v1",
+                    "type": "Venue",
+                    "id": "clip:test:venue:perf",
+                    "name": "Performance Test Venue",
+                }
+            ).encode()
             mock_response.headers = {}
             mock_response.raise_for_status.return_value = None
             return mock_response